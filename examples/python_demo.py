@@ -11,14 +11,13 @@ import os
 # Add python module to path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'python'))
 
+import deepsql
+
 try:
-    import deepsql
-except ImportError:
-    print("❌ DeepSQL Python bindings not installed.")
-    print("\nTo build and install:")
-    print("  1. Install maturin: pip install maturin")
-    print("  2. Build extension: maturin develop --features python")
-    print("  3. Run this script again")
+    deepsql._extension()
+except ImportError as e:
+    print(f"❌ {e}")
+    print("Then run this script again.")
     sys.exit(1)
 
 
@@ -63,12 +62,14 @@ def main():
     
     # Transaction demo
     print("💾 Testing Transactions:")
-    db.begin()
-    print("   Transaction started")
-    db.insert_kv(b"txn_key", b"txn_value")
-    print("   Inserted data in transaction")
-    db.commit()
+    with db.transaction():
+        print("   Transaction started")
+        for i in range(10):
+            db.insert_kv(f"txn_key_{i}".encode(), b"txn_value")
+        print("   Inserted 10 records in one transaction")
     print("   Transaction committed ✅")
+    count = db.insert_many([(b"batch_b", b"2"), (b"batch_a", b"1")])
+    print(f"   insert_many added {count} unsorted records with one commit")
     print()
     
     # Cleanup
@@ -96,8 +97,10 @@ def main():
     
     # Cleanup demo databases
     for f in ["demo.db", "demo.db-wal", "demo.db-lock", "demo2.db", "demo2.db-wal", "demo2.db-lock"]:
-        if os.path.exists(f):
-            os.remove(f)
+        try:
+            os.unlink(f)
+        except FileNotFoundError:
+            pass
 
 
 if __name__ == '__main__':
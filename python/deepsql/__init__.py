@@ -27,24 +27,80 @@ Context Manager:
 
 __version__ = "0.1.0"
 
-try:
-    from ._deepsql import Database as _RustDatabase, CacheStats
-except ImportError:
-    # Fallback if Rust extension not available
-    _RustDatabase = None
-    CacheStats = None
-
-from typing import List, Tuple, Any, Optional, Union
+from typing import List, Tuple, Any, Optional, Union, Iterator, TYPE_CHECKING
+from array import array
+from contextlib import contextmanager
+from functools import lru_cache
 import os
+import threading
+import weakref
+
+if TYPE_CHECKING:
+    from ._deepsql import Database as _RustDatabase, CacheStats, PreparedStatement
+
+
+@lru_cache(maxsize=None)
+def _extension():
+    """
+    Import the Rust extension on first use
+    
+    Keeps `import deepsql` cheap for code that never opens a database.
+    """
+    try:
+        from . import _deepsql
+    except ImportError as e:
+        raise ImportError(
+            "DeepSQL Rust extension not available. To build and install:\n"
+            "  1. Install maturin: pip install maturin\n"
+            "  2. Build extension: maturin develop --features python"
+        ) from e
+    return _deepsql
+
+
+_EXTENSION_NAMES = ('CacheStats', 'PreparedStatement')
+
+
+def __getattr__(name: str):
+    """
+    Resolve extension classes lazily (PEP 562)
+    
+    A missing extension surfaces as AttributeError, so hasattr() and
+    `from deepsql import *` keep working; call _extension() to get the
+    ImportError with build instructions.
+    """
+    if name == '__all__':
+        try:
+            _extension()
+        except ImportError:
+            return _PYTHON_NAMES
+        return _PYTHON_NAMES + list(_EXTENSION_NAMES)
+    if name in _EXTENSION_NAMES:
+        try:
+            return getattr(_extension(), name)
+        except ImportError as e:
+            raise AttributeError(
+                f"module {__name__!r} has no attribute {name!r} "
+                "(the Rust extension is not built)"
+            ) from e
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 class Database:
     """
     DeepSQL Database Connection
     
-    High-level Python interface to DeepSQL embedded database.
+    Pure-Python wrapper around the Rust connection class. connect() returns
+    the Rust class directly, which exposes the same API without the extra
+    method call; this wrapper is kept for code that subclasses Database.
     """
     
+    __slots__ = (
+        '_db', '_path',
+        '_insert', '_search', '_delete', '_execute_update', '_query',
+        '_begin', '_commit', '_rollback', '_bulk_load',
+        '__weakref__',
+    )
+    
     def __init__(self, path: str):
         """
         Open or create a database
@@ -52,24 +108,34 @@ class Database:
         Args:
             path: Path to the database file
         """
-        if _RustDatabase is None:
-            raise ImportError("DeepSQL Rust extension not available. Install with: pip install deepsql")
-        
-        self._db = _RustDatabase(path)
+        self._db = _extension().Database(path)
         self._path = path
-        self._in_transaction = False
+        
+        # Bind hot Rust methods once instead of looking them up on every call
+        self._insert = self._db.insert
+        self._search = self._db.search
+        self._delete = self._db.delete
+        self._execute_update = self._db.execute_update
+        self._query = self._db.query
+        self._begin = self._db.begin_transaction
+        self._commit = self._db.commit
+        self._rollback = self._db.rollback
+        self._bulk_load = self._db.bulk_load
     
     def execute(self, sql: str) -> int:
         """
         Execute a SQL statement
         
+        Parsed statements are cached per connection, so repeating the same
+        SQL text skips the parser. CREATE statements clear the cache.
+        
         Args:
             sql: SQL statement to execute
             
         Returns:
             Number of rows affected (for INSERT/UPDATE/DELETE)
         """
-        return self._db.execute_update(sql)
+        return self._execute_update(sql)
     
     def query(self, sql: str) -> List[Tuple[Any, ...]]:
         """
@@ -81,36 +147,127 @@ class Database:
         Returns:
             List of tuples, one per row
         """
-        rows = self._db.query(sql)
-        return [tuple(row) for row in rows]
+        return self._query(sql)
+    
+    def query_columns(self, sql: str) -> List[Union[array, List[Any]]]:
+        """
+        Execute a SQL query and return the result column by column
+        
+        INTEGER and REAL columns come back as array('q') / array('d'),
+        so values stay unboxed until read; other columns are lists. An
+        empty result yields one empty list per selected column.
+        
+        Args:
+            sql: SQL SELECT statement
+            
+        Returns:
+            List with one container per column
+        """
+        return self._db.query_columns(sql)
+    
+    def prepare(self, sql: str) -> 'PreparedStatement':
+        """
+        Parse a SQL statement once for repeated execution
+        
+        Args:
+            sql: SQL statement to prepare
+            
+        Returns:
+            PreparedStatement for execute_prepared()/query_prepared()
+        """
+        return self._db.prepare(sql)
+    
+    def execute_prepared(self, stmt: 'PreparedStatement') -> int:
+        """
+        Execute a prepared statement
+        
+        Args:
+            stmt: Statement returned by prepare()
+            
+        Returns:
+            Number of rows affected (for INSERT/UPDATE/DELETE)
+        """
+        return self._db.execute_prepared(stmt)
+    
+    def query_prepared(self, stmt: 'PreparedStatement') -> List[Tuple[Any, ...]]:
+        """
+        Execute a prepared query and return all rows
+        
+        Args:
+            stmt: Statement returned by prepare()
+            
+        Returns:
+            List of tuples, one per row
+        """
+        return self._db.query_prepared(stmt)
     
     def query_one(self, sql: str) -> Optional[Tuple[Any, ...]]:
         """
         Execute a SQL query and return the first row
         
+        Runs SELECTs with LIMIT capped at 1, so without ORDER BY or
+        aggregates the scan stops at the first row.
+        
         Args:
             sql: SQL SELECT statement
             
         Returns:
             First row as tuple, or None if no results
         """
-        rows = self.query(sql)
-        return rows[0] if rows else None
+        return self._db.query_first(sql)
     
     def begin(self):
         """Begin a transaction"""
-        self._db.begin_transaction()
-        self._in_transaction = True
+        self._begin()
     
     def commit(self):
         """Commit the current transaction"""
-        self._db.commit()
-        self._in_transaction = False
+        self._commit()
     
     def rollback(self):
         """Rollback the current transaction"""
-        self._db.rollback()
-        self._in_transaction = False
+        self._rollback()
+    
+    @property
+    def in_transaction(self) -> bool:
+        """Whether a transaction is currently open"""
+        return self._db.in_transaction
+    
+    @contextmanager
+    def transaction(self) -> Iterator['Database']:
+        """
+        Run a block in one transaction
+        
+        Commits when the block exits normally, rolls back if it raises.
+        Batching writes this way pays the commit cost once per block
+        instead of once per insert_kv call.
+        
+        Example:
+            >>> with db.transaction():
+            ...     for key, value in records:
+            ...         db.insert_kv(key, value)
+        """
+        self.begin()
+        try:
+            yield self
+        except BaseException:
+            self.rollback()
+            raise
+        self.commit()
+    
+    def insert_many(self, records: List[Tuple[bytes, bytes]]) -> int:
+        """
+        Insert many key-value pairs in a single transaction
+        
+        Unlike bulk_load, existing records are kept.
+        
+        Args:
+            records: List of (key, value) tuples
+            
+        Returns:
+            Number of records inserted
+        """
+        return self._db.insert_many(records)
     
     def insert_kv(self, key: bytes, value: bytes):
         """
@@ -120,7 +277,7 @@ class Database:
             key: Record key (bytes)
             value: Record value (bytes)
         """
-        self._db.insert(list(key), list(value))
+        self._insert(key, value)
     
     def search_kv(self, key: bytes) -> Optional[bytes]:
         """
@@ -130,10 +287,37 @@ class Database:
             key: Record key (bytes)
             
         Returns:
-            Record value (bytes) or None if not found
+            Value stored by insert_kv (bytes), or None if not found
+        """
+        return self._search(key)
+    
+    def search_kv_into(self, key: bytes, out: bytearray) -> Optional[int]:
+        """
+        Low-level key-value search into a reusable buffer
+        
+        Avoids allocating a new bytes object per lookup. The buffer is
+        grown if needed, never shrunk.
+        
+        Args:
+            key: Record key (bytes)
+            out: Buffer to copy the stored value into
+            
+        Returns:
+            Number of bytes written (the value is out[:n]), or None if not found
+        """
+        return self._db.search_kv_into(key, out)
+    
+    def search_kv_many(self, keys: List[bytes]) -> List[Optional[bytes]]:
+        """
+        Low-level key-value search for many keys at once
+        
+        Args:
+            keys: Record keys (bytes)
+            
+        Returns:
+            One result per key, in order: the stored value (bytes) or None
         """
-        result = self._db.search(list(key))
-        return bytes(result) if result else None
+        return self._db.search_kv_many(keys)
     
     def delete_kv(self, key: bytes):
         """
@@ -142,20 +326,91 @@ class Database:
         Args:
             key: Record key (bytes)
         """
-        self._db.delete(list(key))
+        self._delete(key)
     
     def bulk_load(self, records: List[Tuple[bytes, bytes]]) -> int:
         """
         Bulk load records (10-100x faster than sequential inserts)
         
+        Replaces the existing records; an empty list clears them. Input is
+        sorted in Rust with the GIL released; for duplicate keys the last
+        value wins.
+        
+        Args:
+            records: List of (key, value) tuples, in any order
+            
+        Returns:
+            Number of records loaded
+        """
+        return self._bulk_load(records)
+    
+    def bulk_load_buffers(self, keys: bytes, key_offsets: array,
+                          values: bytes, value_offsets: array) -> int:
+        """
+        Bulk load records from packed buffers
+        
+        Avoids building one tuple and two bytes objects per record.
+        Use pack_records() to build the buffers from (key, value) pairs.
+        
+        Args:
+            keys: Concatenated record keys
+            key_offsets: array('Q') of N+1 offsets into keys
+            values: Concatenated record values
+            value_offsets: array('Q') of N+1 offsets into values
+            
+        Returns:
+            Number of records loaded
+        """
+        return self._db.bulk_load_buffers(keys, key_offsets, values, value_offsets)
+    
+    def bulk_load_numpy(self, keys, values) -> int:
+        """
+        Bulk load records from fixed-width columns
+        
         Args:
-            records: List of (key, value) tuples, must be sorted by key
+            keys: 2-D uint8 array of shape (N, key_width)
+            values: 2-D uint8 array of shape (N, value_width)
             
+        Any C-contiguous buffer works, e.g. a NumPy array or
+        memoryview(data).cast('B', (N, width)); NumPy is not required.
+        
         Returns:
             Number of records loaded
         """
-        rust_records = [(list(k), list(v)) for k, v in records]
-        return self._db.bulk_load(rust_records)
+        return self._db.bulk_load_numpy(keys, values)
+    
+    def set_synchronous(self, mode: str):
+        """
+        Set when commits fsync to disk
+        
+        Args:
+            mode: "FULL" (default) syncs the WAL and the database header;
+                "NORMAL" syncs the WAL on every commit but leaves the
+                database file to WAL recovery until the next checkpoint;
+                "OFF" never syncs, so an OS crash or power loss can lose or
+                corrupt recent commits.
+        
+        Example:
+            >>> db.set_synchronous("OFF")
+            >>> db.bulk_load(records)
+            >>> db.set_synchronous("FULL")
+            >>> db.checkpoint()
+        """
+        self._db.set_synchronous(mode)
+    
+    @property
+    def synchronous(self) -> str:
+        """Current fsync policy: FULL, NORMAL or OFF"""
+        return self._db.synchronous
+    
+    def checkpoint(self) -> int:
+        """
+        Copy the WAL into the database file and truncate it
+        
+        Returns:
+            Number of pages written
+        """
+        return self._db.checkpoint()
     
     def collect_statistics(self, table: str):
         """
@@ -176,13 +431,11 @@ class Database:
         return self._db.get_cache_stats()
     
     def clear_cache(self):
-        """Clear the query plan cache"""
+        """Clear the query plan and prepared statement caches"""
         self._db.clear_cache()
     
     def close(self):
-        """Close the database connection"""
-        if self._in_transaction:
-            self.rollback()
+        """Close the database connection, rolling back any open transaction"""
         self._db.close()
     
     def __enter__(self):
@@ -191,26 +444,65 @@ class Database:
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Context manager exit"""
-        if exc_type is not None:
-            # Exception occurred, rollback
-            if self._in_transaction:
-                self.rollback()
-        self.close()
+        self._db.close()
         return False
     
     def __repr__(self):
         return f"Database('{self._path}')"
 
 
-def connect(path: str) -> Database:
+def pack_records(records: List[Tuple[bytes, bytes]]) -> Tuple[bytes, array, bytes, array]:
+    """
+    Pack (key, value) pairs into buffers for Database.bulk_load_buffers
+    
+    Args:
+        records: List of (key, value) tuples
+        
+    Returns:
+        (keys, key_offsets, values, value_offsets)
+    """
+    key_offsets = array('Q', [0])
+    value_offsets = array('Q', [0])
+    key_end = value_end = 0
+    for key, value in records:
+        key_end += len(key)
+        value_end += len(value)
+        key_offsets.append(key_end)
+        value_offsets.append(value_end)
+    
+    keys = b"".join([key for key, _ in records])
+    values = b"".join([value for _, value in records])
+    return keys, key_offsets, values, value_offsets
+
+
+# Live connections opened with connect(..., reuse=True), keyed by absolute path.
+# Entries vanish when their connection is garbage collected; the weak
+# dictionary removes them without taking _CONNECTION_CACHE_LOCK, so a
+# collection triggered while connect() holds the lock cannot deadlock.
+_CONNECTION_CACHE: 'weakref.WeakValueDictionary[str, _RustDatabase]' = weakref.WeakValueDictionary()
+_CONNECTION_CACHE_LOCK = threading.Lock()
+
+
+def _prune_connections():
+    """Drop cache entries for closed connections; caller holds the lock"""
+    for key, db in list(_CONNECTION_CACHE.items()):
+        if db.closed:
+            _CONNECTION_CACHE.pop(key, None)
+
+
+def connect(path: str, reuse: bool = False) -> '_RustDatabase':
     """
     Connect to a DeepSQL database
     
     Args:
         path: Path to the database file
+        reuse: Return the existing open connection for this path, if any,
+            instead of opening the database again. Off by default because
+            callers then share one connection (and its transactions).
         
     Returns:
-        Database connection object
+        Database connection object (the Rust extension class, with the same
+        methods as Database)
         
     Example:
         >>> db = deepsql.connect("mydb.db")
@@ -221,14 +513,26 @@ def connect(path: str) -> Database:
         >>> with deepsql.connect("mydb.db") as db:
         ...     db.execute("INSERT INTO users VALUES (1, 'Alice')")
     """
-    return Database(path)
+    rust_database = _extension().Database
+    if not reuse:
+        return rust_database(path)
+    
+    key = os.path.abspath(path)
+    with _CONNECTION_CACHE_LOCK:
+        _prune_connections()
+        db = _CONNECTION_CACHE.get(key)
+        if db is None or db.closed:
+            db = rust_database(path)
+            _CONNECTION_CACHE[key] = db
+        return db
 
 
-# Export main classes and functions
-__all__ = [
+# Export main classes and functions; __getattr__ adds the extension
+# classes to __all__ when the extension is built
+_PYTHON_NAMES = [
     'Database',
     'connect',
-    'CacheStats',
+    'pack_records',
     '__version__',
 ]
 
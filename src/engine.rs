@@ -3,7 +3,8 @@
 /// Provides a high-level interface for interacting with DeepSQL
 
 use crate::error::{Error, Result};
-use crate::storage::{Pager, btree::BTree, record::Record};
+use crate::storage::{Pager, SyncMode, btree::BTree, record::Record};
+use crate::storage::btree::bulk_load::{bulk_load, sort_and_dedup, BulkLoadConfig};
 use crate::wal::{Wal, checkpoint, recover};
 use crate::locking::LockManager;
 use crate::transaction::TransactionContext;
@@ -126,6 +127,9 @@ impl Engine {
         // Restore original pages from pager's shadow copies
         self.pager.rollback_transaction_pages()?;
         
+        // Root splits and bulk loads may have moved the root
+        self.btree.set_root_page_id(self.pager.root_page());
+        
         // Clear transaction state
         self.tx_context.clear();
         self.pager.end_transaction_mode();
@@ -157,11 +161,44 @@ impl Engine {
         Ok(())
     }
     
+    /// Insert many records in a single transaction
+    /// 
+    /// Joins the caller's transaction if one is active, otherwise commits
+    /// once after the last record instead of once per record.
+    pub fn insert_many(&mut self, records: Vec<Record>) -> Result<usize> {
+        let auto_transaction = !self.wal.in_transaction();
+        
+        if auto_transaction {
+            self.begin_transaction()?;
+        }
+        
+        let count = records.len();
+        for record in records {
+            if let Err(e) = self.btree.insert(&mut self.pager, record) {
+                if auto_transaction {
+                    self.rollback_transaction()?;
+                }
+                return Err(e);
+            }
+        }
+        
+        if auto_transaction {
+            self.commit_transaction()?;
+        }
+        
+        Ok(count)
+    }
+    
     /// Search for a record by key
     pub fn search(&mut self, key: &[u8]) -> Result<Record> {
         self.btree.search(&mut self.pager, key)
     }
     
+    /// Search for many keys, returning results in input order
+    pub fn search_many(&mut self, keys: &[&[u8]]) -> Result<Vec<Option<Record>>> {
+        self.btree.search_many(&mut self.pager, keys)
+    }
+    
     /// Delete a record by key (auto-transaction)
     pub fn delete(&mut self, key: &[u8]) -> Result<()> {
         let auto_transaction = !self.wal.in_transaction();
@@ -179,11 +216,58 @@ impl Engine {
         Ok(())
     }
     
+    /// Bulk load records (auto-transaction)
+    /// 
+    /// Builds a fresh B+Tree bottom-up from `records` and makes it the
+    /// main table, replacing any previously stored records (an empty
+    /// `records` clears the table). Input need not be sorted; for
+    /// duplicate keys the last record wins.
+    pub fn bulk_load(&mut self, records: Vec<Record>) -> Result<usize> {
+        let records = sort_and_dedup(records);
+        let auto_transaction = !self.wal.in_transaction();
+        
+        if auto_transaction {
+            self.begin_transaction()?;
+        }
+        
+        let config = BulkLoadConfig::default();
+        let count = match bulk_load(&mut self.btree, &mut self.pager, records, &config) {
+            Ok(count) => count,
+            Err(e) => {
+                if auto_transaction {
+                    self.rollback_transaction()?;
+                }
+                return Err(e);
+            }
+        };
+        
+        if auto_transaction {
+            self.commit_transaction()?;
+        }
+        
+        Ok(count)
+    }
+    
     /// Create a cursor for scanning records
     pub fn scan(&mut self) -> Result<crate::storage::btree::Cursor> {
         self.btree.cursor(&mut self.pager)
     }
     
+    /// Run `f` against the pager for tables other than the main one
+    /// 
+    /// Used to execute SQL on catalog tables. Their B+Trees record root
+    /// splits in the database header, whose root page belongs to the main
+    /// key-value table, so the main root is put back afterwards.
+    pub fn with_table_pager<T>(&mut self, f: impl FnOnce(&mut Pager) -> Result<T>) -> Result<T> {
+        let result = f(&mut self.pager);
+        
+        let main_root = self.btree.root_page_id();
+        if self.pager.root_page() != main_root {
+            self.pager.set_root_page(main_root)?;
+        }
+        result
+    }
+    
     /// Get mutable reference to pager (for cursor operations)
     pub fn pager_mut(&mut self) -> &mut Pager {
         &mut self.pager
@@ -207,6 +291,23 @@ impl Engine {
         checkpoint(&mut self.pager, &mut self.wal)
     }
     
+    /// Set when commits and checkpoints fsync
+    /// 
+    /// `Full` (default) and `Normal` sync the WAL on every commit; `Normal`
+    /// skips the extra database-file sync on header writes and relies on
+    /// WAL recovery instead. `Off` never syncs, trading durability and
+    /// consistency for write throughput, e.g. during a bulk load that is
+    /// followed by `set_sync_mode(Full)` and an explicit `checkpoint()`.
+    pub fn set_sync_mode(&mut self, mode: SyncMode) {
+        self.pager.set_sync_mode(mode);
+        self.wal.set_sync_mode(mode);
+    }
+    
+    /// Get the current sync mode
+    pub fn sync_mode(&self) -> SyncMode {
+        self.pager.sync_mode()
+    }
+    
     /// Get database statistics
     pub fn stats(&self) -> DatabaseStats {
         DatabaseStats {
@@ -218,6 +319,11 @@ impl Engine {
         }
     }
     
+    /// Check if a transaction is active
+    pub fn in_transaction(&self) -> bool {
+        self.wal.in_transaction()
+    }
+    
     /// Get database path
     pub fn path(&self) -> &std::path::Path {
         &self.path
@@ -277,6 +383,225 @@ mod tests {
         assert!(engine.search(&key).is_err());
     }
     
+    #[test]
+    fn test_engine_insert_many() {
+        let temp_file = NamedTempFile::new().unwrap();
+        let mut engine = Engine::open(temp_file.path()).unwrap();
+        
+        let records: Vec<Record> = (0..50)
+            .rev()
+            .map(|i| Record::new(vec![i as u8], vec![Value::Integer(i)]))
+            .collect();
+        
+        assert_eq!(engine.insert_many(records).unwrap(), 50);
+        assert!(!engine.in_transaction());
+        
+        let found = engine.search(&[7]).unwrap();
+        assert_eq!(found.values[0], Value::Integer(7));
+    }
+    
+    #[test]
+    fn test_engine_bulk_load() {
+        let temp_file = NamedTempFile::new().unwrap();
+        let mut engine = Engine::open(temp_file.path()).unwrap();
+        
+        let records: Vec<Record> = (0..200)
+            .rev()
+            .map(|i| Record::new(format!("key_{:05}", i).into_bytes(), vec![Value::Integer(i)]))
+            .collect();
+        
+        let count = engine.bulk_load(records).unwrap();
+        assert_eq!(count, 200);
+        
+        let found = engine.search(b"key_00123").unwrap();
+        assert_eq!(found.values[0], Value::Integer(123));
+    }
+    
+    #[test]
+    fn test_engine_bulk_load_multi_level() {
+        let temp_file = NamedTempFile::new().unwrap();
+        let path = temp_file.path().to_path_buf();
+        let mut engine = Engine::open(&path).unwrap();
+        
+        // Enough records for several leaves and an interior level
+        let records: Vec<Record> = (0..5000)
+            .map(|i| Record::new(format!("key_{:05}", i).into_bytes(), vec![Value::Integer(i)]))
+            .collect();
+        
+        assert_eq!(engine.bulk_load(records).unwrap(), 5000);
+        assert!(!engine.in_transaction());
+        
+        for i in 0..5000 {
+            let key = format!("key_{:05}", i).into_bytes();
+            let found = engine.search(&key).unwrap();
+            assert_eq!(found.values[0], Value::Integer(i));
+        }
+        assert!(engine.search(b"key_99999").is_err());
+        
+        // The loaded tree survives reopening
+        drop(engine);
+        let mut engine = Engine::open(&path).unwrap();
+        assert_eq!(engine.search(b"key_04321").unwrap().values[0], Value::Integer(4321));
+    }
+    
+    #[test]
+    fn test_engine_bulk_load_unsorted_multi_level() {
+        let temp_file = NamedTempFile::new().unwrap();
+        let mut engine = Engine::open(temp_file.path()).unwrap();
+        
+        // Interleave two halves so the input is unsorted, then repeat a key
+        let mut records: Vec<Record> = (0..1500)
+            .map(|i| (i % 2) * 1500 + i / 2)
+            .map(|i| Record::new(format!("key_{:05}", i).into_bytes(), vec![Value::Integer(i)]))
+            .collect();
+        records.push(Record::new(b"key_00010".to_vec(), vec![Value::Integer(-1)]));
+        
+        assert_eq!(engine.bulk_load(records).unwrap(), 1500);
+        assert_eq!(engine.search(b"key_00010").unwrap().values[0], Value::Integer(-1));
+        for i in (0..750).chain(1500..2250).filter(|&i| i != 10) {
+            let key = format!("key_{:05}", i).into_bytes();
+            assert_eq!(engine.search(&key).unwrap().values[0], Value::Integer(i));
+        }
+    }
+    
+    #[test]
+    fn test_engine_bulk_load_dedup() {
+        let temp_file = NamedTempFile::new().unwrap();
+        let mut engine = Engine::open(temp_file.path()).unwrap();
+        
+        let records = vec![
+            Record::new(b"b".to_vec(), vec![Value::Integer(1)]),
+            Record::new(b"a".to_vec(), vec![Value::Integer(2)]),
+            Record::new(b"b".to_vec(), vec![Value::Integer(3)]),
+        ];
+        
+        assert_eq!(engine.bulk_load(records).unwrap(), 2);
+        assert_eq!(engine.search(b"a").unwrap().values[0], Value::Integer(2));
+        assert_eq!(engine.search(b"b").unwrap().values[0], Value::Integer(3));
+    }
+    
+    #[test]
+    fn test_engine_bulk_load_replaces_and_reuses_pages() {
+        let temp_file = NamedTempFile::new().unwrap();
+        let mut engine = Engine::open(temp_file.path()).unwrap();
+        
+        let load = |engine: &mut Engine, value: i64| {
+            let records: Vec<Record> = (0..2000)
+                .map(|i| Record::new(format!("key_{:05}", i).into_bytes(), vec![Value::Integer(value)]))
+                .collect();
+            engine.bulk_load(records).unwrap();
+        };
+        
+        load(&mut engine, 1);
+        let page_count = engine.stats().page_count;
+        
+        // Replacing the tree reuses the old tree's pages
+        load(&mut engine, 2);
+        assert_eq!(engine.stats().page_count, page_count);
+        assert_eq!(engine.search(b"key_01999").unwrap().values[0], Value::Integer(2));
+    }
+    
+    #[test]
+    fn test_engine_bulk_load_empty_clears() {
+        let temp_file = NamedTempFile::new().unwrap();
+        let mut engine = Engine::open(temp_file.path()).unwrap();
+        
+        let records: Vec<Record> = (0..2000)
+            .map(|i| Record::new(format!("key_{:05}", i).into_bytes(), vec![Value::Integer(i)]))
+            .collect();
+        engine.bulk_load(records).unwrap();
+        let page_count = engine.stats().page_count;
+        
+        // Like any other load, an empty one replaces the existing records
+        assert_eq!(engine.bulk_load(Vec::new()).unwrap(), 0);
+        assert!(engine.search(b"key_00000").is_err());
+        assert!(engine.search(b"key_01999").is_err());
+        assert_eq!(engine.stats().page_count, page_count);
+        
+        engine.insert(Record::new(b"after".to_vec(), vec![Value::Integer(1)])).unwrap();
+        assert_eq!(engine.search(b"after").unwrap().values[0], Value::Integer(1));
+    }
+    
+    #[test]
+    fn test_engine_bulk_load_rollback() {
+        let temp_file = NamedTempFile::new().unwrap();
+        let mut engine = Engine::open(temp_file.path()).unwrap();
+        
+        engine.insert(Record::new(b"existing".to_vec(), vec![Value::Integer(1)])).unwrap();
+        let before = engine.stats();
+        
+        engine.begin_transaction().unwrap();
+        let records: Vec<Record> = (0..2000)
+            .map(|i| Record::new(format!("key_{:05}", i).into_bytes(), vec![Value::Integer(i)]))
+            .collect();
+        engine.bulk_load(records).unwrap();
+        assert!(engine.search(b"existing").is_err());
+        engine.rollback_transaction().unwrap();
+        
+        let after = engine.stats();
+        assert_eq!(after.root_page_id, before.root_page_id);
+        assert_eq!(after.page_count, before.page_count);
+        assert_eq!(engine.search(b"existing").unwrap().values[0], Value::Integer(1));
+        assert!(engine.search(b"key_00000").is_err());
+    }
+    
+    #[test]
+    fn test_engine_sync_mode_off() {
+        let temp_file = NamedTempFile::new().unwrap();
+        let path = temp_file.path().to_path_buf();
+        
+        {
+            let mut engine = Engine::open(&path).unwrap();
+            engine.set_sync_mode(SyncMode::Off);
+            assert_eq!(engine.sync_mode(), SyncMode::Off);
+            
+            for i in 0..20u8 {
+                engine.insert(Record::new(vec![i], vec![Value::Integer(i as i64)])).unwrap();
+            }
+            engine.set_sync_mode(SyncMode::Full);
+            
+            // The commits above left their pages in the WAL
+            assert!(engine.checkpoint().unwrap() > 0);
+            assert_eq!(engine.checkpoint().unwrap(), 0);
+        }
+        
+        let mut engine = Engine::open(&path).unwrap();
+        let found = engine.search(&[19]).unwrap();
+        assert_eq!(found.values[0], Value::Integer(19));
+    }
+    
+    #[test]
+    fn test_engine_sql_keeps_main_root() {
+        use crate::sql::{lexer::Lexer, parser::Parser};
+        use crate::sql_engine::SqlSession;
+        
+        let temp_file = NamedTempFile::new().unwrap();
+        let mut engine = Engine::open(temp_file.path()).unwrap();
+        engine.insert(Record::new(b"kv".to_vec(), vec![Value::Integer(1)])).unwrap();
+        let main_root = engine.stats().root_page_id;
+        
+        let mut session = SqlSession::new();
+        let mut run = |engine: &mut Engine, sql: &str| {
+            let statement = Parser::new(Lexer::new(sql).tokenize()).parse_statement().unwrap();
+            engine.with_table_pager(|pager| session.execute_statement(pager, statement)).unwrap()
+        };
+        
+        run(&mut engine, "CREATE TABLE t (id INTEGER PRIMARY KEY, name TEXT)");
+        for i in 1..=20 {
+            run(&mut engine, &format!("INSERT INTO t VALUES ({}, 'name_{:05}')", i, i));
+        }
+        let result = run(&mut engine, "SELECT * FROM t");
+        assert_eq!(result.rows.len(), 20);
+        
+        // Enough rows to split the SQL table's root, which must not move
+        // the key-value root
+        for i in 21..=300 {
+            run(&mut engine, &format!("INSERT INTO t VALUES ({}, 'name_{:05}')", i, i));
+        }
+        assert_eq!(engine.pager_mut().root_page(), main_root);
+        assert_eq!(engine.search(b"kv").unwrap().values[0], Value::Integer(1));
+    }
+    
     #[test]
     fn test_engine_persistence() {
         let temp_file = NamedTempFile::new().unwrap();
@@ -5,7 +5,24 @@
 #[cfg(feature = "python")]
 use pyo3::prelude::*;
 #[cfg(feature = "python")]
-use pyo3::exceptions::PyException;
+use pyo3::exceptions::{PyException, PyValueError};
+#[cfg(feature = "python")]
+use pyo3::buffer::PyBuffer;
+#[cfg(feature = "python")]
+use pyo3::marker::Ungil;
+#[cfg(feature = "python")]
+use pyo3::types::{PyByteArray, PyBytes, PyList, PyTuple};
+
+#[cfg(feature = "python")]
+use std::borrow::Cow;
+#[cfg(feature = "python")]
+use std::collections::HashMap;
+#[cfg(feature = "python")]
+use std::sync::{Arc, Mutex, MutexGuard, TryLockError};
+#[cfg(feature = "python")]
+use std::ops::{Deref, DerefMut};
+#[cfg(feature = "python")]
+use std::sync::atomic::{AtomicBool, Ordering};
 
 #[cfg(feature = "python")]
 use crate::engine::Engine;
@@ -16,9 +33,21 @@ use crate::types::Value;
 #[cfg(feature = "python")]
 use crate::storage::record::Record;
 #[cfg(feature = "python")]
+use crate::storage::SyncMode;
+#[cfg(feature = "python")]
 use crate::planner::plan_cache::PlanCache;
 #[cfg(feature = "python")]
 use crate::planner::statistics::StatisticsManager;
+#[cfg(feature = "python")]
+use crate::sql::{ast::Statement, lexer::Lexer, parser::Parser};
+#[cfg(feature = "python")]
+use crate::sql_engine::SqlSession;
+#[cfg(feature = "python")]
+use crate::vm::executor::QueryResult;
+
+/// Maximum number of parsed statements cached per connection
+#[cfg(feature = "python")]
+const STATEMENT_CACHE_SIZE: usize = 256;
 
 /// Convert Rust Error to Python exception
 #[cfg(feature = "python")]
@@ -26,13 +55,446 @@ fn to_pyerr(err: RustError) -> PyErr {
     PyException::new_err(err.to_string())
 }
 
+/// Build a key/blob record from borrowed byte slices
+#[cfg(feature = "python")]
+fn blob_record(key: &[u8], value: &[u8]) -> Record {
+    Record::new(key.to_vec(), vec![crate::storage::record::Value::Blob(value.to_vec())])
+}
+
+/// Bytes returned to Python for a key-value lookup
+/// 
+/// This is the Blob stored by `insert_kv`. Records without a Blob value
+/// (not written through the key-value API) yield empty bytes.
+#[cfg(feature = "python")]
+fn kv_payload(record: &Record) -> &[u8] {
+    match record.values.first() {
+        Some(crate::storage::record::Value::Blob(value)) => value,
+        _ => &[],
+    }
+}
+
+/// Extract records from a list of (key, value) tuples
+/// 
+/// Keys and values may be bytes or bytearray, like the single-record calls.
+#[cfg(feature = "python")]
+fn records_from_list(records: &Bound<'_, PyList>) -> PyResult<Vec<Record>> {
+    let mut rust_records = Vec::with_capacity(records.len());
+    for item in records.iter() {
+        // Cow<[u8]> borrows from its source, so extract it from each element
+        let (key, value): (Bound<'_, PyAny>, Bound<'_, PyAny>) = item.extract()?;
+        let (key, value): (Cow<'_, [u8]>, Cow<'_, [u8]>) = (key.extract()?, value.extract()?);
+        rust_records.push(blob_record(&key, &value));
+    }
+    Ok(rust_records)
+}
+
+/// Slice packed key/value buffers into records
+/// 
+/// `key_offsets` and `value_offsets` hold N+1 monotonically increasing
+/// offsets, so record `i` spans `offsets[i]..offsets[i + 1]`.
+#[cfg(feature = "python")]
+fn records_from_buffers(
+    keys: &[u8],
+    key_offsets: &[u64],
+    values: &[u8],
+    value_offsets: &[u64],
+) -> PyResult<Vec<Record>> {
+    if key_offsets.len() != value_offsets.len() {
+        return Err(PyValueError::new_err("key_offsets and value_offsets must have the same length"));
+    }
+    
+    let count = key_offsets.len().saturating_sub(1);
+    let mut records = Vec::with_capacity(count);
+    
+    for i in 0..count {
+        let key = buffer_slice(keys, key_offsets[i], key_offsets[i + 1])?;
+        let value = buffer_slice(values, value_offsets[i], value_offsets[i + 1])?;
+        records.push(blob_record(key, value));
+    }
+    
+    Ok(records)
+}
+
+/// Rows and row width of a 2-D C-contiguous uint8 buffer
+#[cfg(feature = "python")]
+fn matrix_shape(buf: &PyBuffer<u8>, name: &str) -> PyResult<(usize, usize)> {
+    let shape = buf.shape();
+    if shape.len() != 2 || !buf.is_c_contiguous() {
+        return Err(PyValueError::new_err(format!(
+            "{} must be a 2-D C-contiguous uint8 array", name
+        )));
+    }
+    if shape[1] == 0 {
+        return Err(PyValueError::new_err(format!("{} rows must not be empty", name)));
+    }
+    Ok((shape[0], shape[1]))
+}
+
+/// Bounds-checked `buf[start..end]` for offsets coming from Python
+#[cfg(feature = "python")]
+fn buffer_slice(buf: &[u8], start: u64, end: u64) -> PyResult<&[u8]> {
+    let (start, end) = (start as usize, end as usize);
+    if start > end || end > buf.len() {
+        return Err(PyValueError::new_err(format!(
+            "invalid offsets {}..{} for buffer of length {}", start, end, buf.len()
+        )));
+    }
+    Ok(&buf[start..end])
+}
+
+/// Lex and parse a single SQL statement
+#[cfg(feature = "python")]
+fn parse_sql(sql: &str) -> PyResult<Statement> {
+    let tokens = Lexer::new(sql).tokenize();
+    Parser::new(tokens).parse_statement().map_err(to_pyerr)
+}
+
+/// Check if a statement changes the schema
+#[cfg(feature = "python")]
+fn is_ddl(statement: &Statement) -> bool {
+    matches!(statement, Statement::CreateTable(_) | Statement::CreateIndex(_))
+}
+
+/// Copy of a SELECT with its LIMIT capped at one row
+/// 
+/// Takes the place of the clone every run makes anyway. Returns None for
+/// other statements, which are run unchanged.
+#[cfg(feature = "python")]
+fn limit_to_first_row(statement: &Statement) -> Option<Statement> {
+    match statement {
+        Statement::Select(select) => {
+            let mut select = select.clone();
+            select.limit = Some(select.limit.map_or(1, |limit| limit.min(1)));
+            Some(Statement::Select(select))
+        }
+        _ => None,
+    }
+}
+
+/// Parsed statements keyed by exact SQL text, evicting the least recently used
+/// 
+/// Keys are not normalized: whitespace inside string literals is part of
+/// the statement, so collapsing it would make different statements collide.
+#[cfg(feature = "python")]
+struct StatementCache {
+    /// SQL -> (statement, last use)
+    entries: HashMap<String, (Arc<Statement>, u64)>,
+    
+    /// Logical clock for recency
+    tick: u64,
+}
+
+#[cfg(feature = "python")]
+impl StatementCache {
+    fn new() -> Self {
+        StatementCache {
+            entries: HashMap::new(),
+            tick: 0,
+        }
+    }
+    
+    /// Look up a statement, marking it as most recently used
+    fn get(&mut self, sql: &str) -> Option<Arc<Statement>> {
+        self.tick += 1;
+        let tick = self.tick;
+        self.entries.get_mut(sql).map(|(statement, last_used)| {
+            *last_used = tick;
+            Arc::clone(statement)
+        })
+    }
+    
+    /// Store a statement, evicting the least recently used one if full
+    fn put(&mut self, sql: String, statement: Arc<Statement>) {
+        if self.entries.len() >= STATEMENT_CACHE_SIZE && !self.entries.contains_key(&sql) {
+            let oldest = self.entries
+                .iter()
+                .min_by_key(|(_, (_, last_used))| *last_used)
+                .map(|(sql, _)| sql.clone());
+            if let Some(oldest) = oldest {
+                self.entries.remove(&oldest);
+            }
+        }
+        
+        self.tick += 1;
+        self.entries.insert(sql, (statement, self.tick));
+    }
+    
+    fn clear(&mut self) {
+        self.entries.clear();
+    }
+}
+
+/// Lock a mutex, mapping a poisoned lock to a Python exception
+#[cfg(feature = "python")]
+fn lock<T>(mutex: &Mutex<T>) -> PyResult<MutexGuard<'_, T>> {
+    mutex.lock().map_err(|_| poisoned())
+}
+
+/// Error for a mutex poisoned by a panic in another thread
+#[cfg(feature = "python")]
+fn poisoned() -> PyErr {
+    PyException::new_err("Database lock poisoned by a panic in another thread")
+}
+
+/// Error for a call on a closed connection
+#[cfg(feature = "python")]
+fn closed_error() -> PyErr {
+    PyException::new_err("Database is closed")
+}
+
+/// Locked engine of an open connection
+/// 
+/// Only built over a `Some` engine, so dereferencing never fails.
+#[cfg(feature = "python")]
+struct EngineGuard<'a>(MutexGuard<'a, Option<Engine>>);
+
+#[cfg(feature = "python")]
+impl<'a> EngineGuard<'a> {
+    /// Wrap a locked slot, failing if close() already dropped the engine
+    fn new(guard: MutexGuard<'a, Option<Engine>>) -> PyResult<Self> {
+        if guard.is_none() {
+            return Err(closed_error());
+        }
+        Ok(EngineGuard(guard))
+    }
+}
+
+#[cfg(feature = "python")]
+impl Deref for EngineGuard<'_> {
+    type Target = Engine;
+    
+    fn deref(&self) -> &Engine {
+        self.0.as_ref().expect("engine checked open when locked")
+    }
+}
+
+#[cfg(feature = "python")]
+impl DerefMut for EngineGuard<'_> {
+    fn deref_mut(&mut self) -> &mut Engine {
+        self.0.as_mut().expect("engine checked open when locked")
+    }
+}
+
 /// Python Database class
+/// 
+/// This is the object returned by `deepsql.connect()`, so it carries the
+/// complete public API (`execute`, `query`, `insert_kv`, ...) and Python
+/// calls land here without a wrapper in between. The older method names
+/// (`execute_update`, `insert`, ...) remain for the `deepsql.Database` shim.
+/// 
+/// Methods never wait for the engine lock while holding the GIL: writes
+/// and long-running calls release it up front, and short reads release it
+/// only if the lock is contended (see `with_engine`). All state sits behind
+/// mutexes and is only touched with the lock held. Code running inside
+/// `allow_threads` must not call back into Python without re-acquiring the
+/// GIL via `Python::with_gil`.
 #[cfg(feature = "python")]
-#[pyclass]
+#[pyclass(weakref)]
 pub struct Database {
-    engine: Engine,
-    plan_cache: PlanCache,
-    stats_manager: StatisticsManager,
+    /// None once closed, which releases the file locks
+    engine: Mutex<Option<Engine>>,
+    plan_cache: Mutex<PlanCache>,
+    stats_manager: Mutex<StatisticsManager>,
+    statements: Mutex<StatementCache>,
+    sql: Mutex<SqlSession>,
+    path: String,
+    closed: AtomicBool,
+}
+
+#[cfg(feature = "python")]
+impl Database {
+    /// Lock the storage engine
+    fn engine(&self) -> PyResult<EngineGuard<'_>> {
+        if self.closed.load(Ordering::Acquire) {
+            return Err(closed_error());
+        }
+        EngineGuard::new(lock(&self.engine)?)
+    }
+    
+    /// Parse `sql`, reusing the cached statement for repeated SQL text
+    fn prepare_cached(&self, sql: &str) -> PyResult<Arc<Statement>> {
+        if let Some(statement) = lock(&self.statements)?.get(sql) {
+            return Ok(statement);
+        }
+        
+        let statement = Arc::new(parse_sql(sql)?);
+        if !is_ddl(&statement) {
+            lock(&self.statements)?.put(sql.to_string(), Arc::clone(&statement));
+        }
+        Ok(statement)
+    }
+    
+    /// Run a short engine call, releasing the GIL only if it must wait
+    /// 
+    /// Tries the lock with the GIL held, which is cheapest for quick reads.
+    /// If another thread holds the lock (e.g. during a bulk load), waits for
+    /// it with the GIL released so other Python threads keep running.
+    fn with_engine<T, F>(&self, py: Python<'_>, f: F) -> PyResult<T>
+    where
+        F: FnOnce(&mut Engine) -> PyResult<T> + Ungil,
+        T: Ungil,
+    {
+        if self.closed.load(Ordering::Acquire) {
+            return Err(closed_error());
+        }
+        match self.engine.try_lock() {
+            Ok(guard) => f(&mut EngineGuard::new(guard)?),
+            Err(TryLockError::WouldBlock) => py.allow_threads(|| f(&mut *self.engine()?)),
+            Err(TryLockError::Poisoned(_)) => Err(poisoned()),
+        }
+    }
+    
+    /// Look up a key, mapping "not found" to None
+    fn lookup(&self, py: Python<'_>, key: &[u8]) -> PyResult<Option<Record>> {
+        self.with_engine(py, |engine| match engine.search(key) {
+            Ok(record) => Ok(Some(record)),
+            Err(RustError::NotFound) => Ok(None),
+            Err(e) => Err(to_pyerr(e)),
+        })
+    }
+    
+    /// Run a parsed statement against the engine
+    /// 
+    /// BEGIN/COMMIT/ROLLBACK drive the engine transaction. Other writes run
+    /// in their own transaction unless one is already open. The executor
+    /// consumes its statement, so callers pass a clone of the cached one,
+    /// which is still much cheaper than lexing and parsing again.
+    fn run_statement(&self, statement: Statement) -> PyResult<QueryResult> {
+        let ddl = is_ddl(&statement);
+        let mut engine = self.engine()?;
+        let result = match statement {
+            Statement::Begin => engine.begin_transaction().map(|_| QueryResult::new()),
+            Statement::Commit => engine.commit_transaction().map(|_| QueryResult::new()),
+            Statement::Rollback => engine.rollback_transaction().map(|_| QueryResult::new()),
+            statement @ Statement::Select(_) => {
+                let mut sql = lock(&self.sql)?;
+                engine.with_table_pager(|pager| sql.execute_statement(pager, statement))
+            }
+            statement => {
+                let mut sql = lock(&self.sql)?;
+                let auto_transaction = !engine.in_transaction();
+                if auto_transaction {
+                    engine.begin_transaction().map_err(to_pyerr)?;
+                }
+                
+                let result = engine.with_table_pager(|pager| sql.execute_statement(pager, statement));
+                if auto_transaction {
+                    match &result {
+                        Ok(_) => engine.commit_transaction().map_err(to_pyerr)?,
+                        Err(_) => engine.rollback_transaction().map_err(to_pyerr)?,
+                    }
+                }
+                result
+            }
+        }
+        .map_err(to_pyerr)?;
+        
+        if ddl {
+            // Schema changed: cached statements and plans may be stale
+            self.invalidate_caches()?;
+        }
+        Ok(result)
+    }
+    
+    /// Drop all cached statements and plans
+    fn invalidate_caches(&self) -> PyResult<()> {
+        lock(&self.statements)?.clear();
+        lock(&self.plan_cache)?.invalidate_all();
+        Ok(())
+    }
+    
+    /// Parse (or reuse) and run `sql` with the GIL released
+    fn run_sql(&self, py: Python<'_>, sql: &str) -> PyResult<QueryResult> {
+        py.allow_threads(|| {
+            let statement = self.prepare_cached(sql)?;
+            self.run_statement(Statement::clone(&statement))
+        })
+    }
+}
+
+/// Convert a value to the matching Python object
+#[cfg(feature = "python")]
+fn value_to_object(py: Python<'_>, value: &Value) -> PyObject {
+    match value {
+        Value::Null => py.None(),
+        Value::Integer(i) => i.to_object(py),
+        Value::Real(f) => f.to_object(py),
+        Value::Text(s) => s.to_object(py),
+        Value::Blob(b) => PyBytes::new_bound(py, b).into_any().unbind(),
+    }
+}
+
+/// Convert a result row to a Python tuple
+#[cfg(feature = "python")]
+fn row_to_tuple<'py>(py: Python<'py>, row: &[Value]) -> Bound<'py, PyTuple> {
+    PyTuple::new_bound(py, row.iter().map(|value| value_to_object(py, value)))
+}
+
+/// Convert one result column to the most compact Python container
+/// 
+/// All-INTEGER columns become `array('q')` and all-REAL columns
+/// `array('d')`, filled from one native buffer without boxing each value;
+/// anything else (TEXT, BLOB, NULLs, mixed types) becomes a list, as does
+/// a column with no rows, whose type is unknown.
+#[cfg(feature = "python")]
+fn column_to_object(
+    py: Python<'_>,
+    array_type: &Bound<'_, PyAny>,
+    rows: &[Vec<Value>],
+    col: usize,
+) -> PyResult<PyObject> {
+    let column = || rows.iter().map(move |row| row.get(col));
+    
+    if rows.is_empty() {
+        return Ok(PyList::empty_bound(py).into_any().unbind());
+    }
+    if column().all(|value| matches!(value, Some(Value::Integer(_)))) {
+        return typed_array(py, array_type, "q", rows.len(), |i| match rows[i].get(col) {
+            Some(Value::Integer(v)) => v.to_ne_bytes(),
+            _ => unreachable!("column checked to be all INTEGER"),
+        });
+    }
+    if column().all(|value| matches!(value, Some(Value::Real(_)))) {
+        return typed_array(py, array_type, "d", rows.len(), |i| match rows[i].get(col) {
+            Some(Value::Real(v)) => v.to_ne_bytes(),
+            _ => unreachable!("column checked to be all REAL"),
+        });
+    }
+    
+    let values = column().map(|value| match value {
+        Some(value) => value_to_object(py, value),
+        None => py.None(),
+    });
+    Ok(PyList::new_bound(py, values).into_any().unbind())
+}
+
+/// Build an `array.array` of `typecode` holding `len` 8-byte values
+/// 
+/// Values are written straight into one `bytes` buffer, which the array
+/// then copies in a single `frombytes` call.
+#[cfg(feature = "python")]
+fn typed_array(
+    py: Python<'_>,
+    array_type: &Bound<'_, PyAny>,
+    typecode: &str,
+    len: usize,
+    value: impl Fn(usize) -> [u8; 8],
+) -> PyResult<PyObject> {
+    let bytes = PyBytes::new_bound_with(py, len * 8, |buf| {
+        for (i, chunk) in buf.chunks_exact_mut(8).enumerate() {
+            chunk.copy_from_slice(&value(i));
+        }
+        Ok(())
+    })?;
+    let array = array_type.call1((typecode,))?;
+    array.call_method1("frombytes", (bytes,))?;
+    Ok(array.unbind())
+}
+
+/// Convert result rows to a Python list of tuples
+#[cfg(feature = "python")]
+fn rows_to_list<'py>(py: Python<'py>, rows: &[Vec<Value>]) -> Bound<'py, PyList> {
+    PyList::new_bound(py, rows.iter().map(|row| row_to_tuple(py, row)))
 }
 
 #[cfg(feature = "python")]
@@ -43,75 +505,329 @@ impl Database {
     fn new(path: String) -> PyResult<Self> {
         let engine = Engine::open(&path).map_err(to_pyerr)?;
         Ok(Database {
-            engine,
-            plan_cache: PlanCache::new(),
-            stats_manager: StatisticsManager::new(),
+            engine: Mutex::new(Some(engine)),
+            plan_cache: Mutex::new(PlanCache::new()),
+            stats_manager: Mutex::new(StatisticsManager::new()),
+            statements: Mutex::new(StatementCache::new()),
+            sql: Mutex::new(SqlSession::new()),
+            path,
+            closed: AtomicBool::new(false),
         })
     }
     
     /// Execute a SQL query and return number of affected rows
-    fn execute_update(&mut self, _sql: String) -> PyResult<usize> {
-        // Placeholder - full implementation would parse and execute SQL
-        Ok(0)
+    /// 
+    /// Repeated SQL text reuses the cached parsed statement.
+    fn execute_update(&self, py: Python<'_>, sql: String) -> PyResult<usize> {
+        Ok(self.run_sql(py, &sql)?.rows_affected)
+    }
+    
+    /// Execute a query and return all rows as a list of tuples
+    /// 
+    /// Repeated SQL text reuses the cached parsed statement.
+    fn query<'py>(&self, py: Python<'py>, sql: String) -> PyResult<Bound<'py, PyList>> {
+        let result = self.run_sql(py, &sql)?;
+        Ok(rows_to_list(py, &result.rows))
+    }
+    
+    /// Execute a SQL statement and return number of affected rows
+    fn execute(&self, py: Python<'_>, sql: String) -> PyResult<usize> {
+        self.execute_update(py, sql)
+    }
+    
+    /// Execute a query and return only its first row, or None
+    /// 
+    /// SELECTs run with LIMIT capped at 1. Without ORDER BY or aggregates
+    /// the executor then stops scanning after the first row; otherwise it
+    /// still reads every row, but only the first is converted.
+    fn query_first<'py>(&self, py: Python<'py>, sql: String) -> PyResult<Option<Bound<'py, PyTuple>>> {
+        let result = py.allow_threads(|| {
+            let statement = self.prepare_cached(&sql)?;
+            let statement = limit_to_first_row(&statement).unwrap_or_else(|| Statement::clone(&statement));
+            self.run_statement(statement)
+        })?;
+        Ok(result.rows.first().map(|row| row_to_tuple(py, row)))
     }
     
-    /// Execute a query and return all rows
-    fn query(&mut self, _sql: String) -> PyResult<Vec<Vec<PyValue>>> {
-        // Placeholder - full implementation would parse and execute SQL
-        Ok(vec![])
+    /// Execute a query and return the first row, or None
+    fn query_one<'py>(&self, py: Python<'py>, sql: String) -> PyResult<Option<Bound<'py, PyTuple>>> {
+        self.query_first(py, sql)
+    }
+    
+    /// Execute a query and return its result column by column
+    /// 
+    /// Returns one container per column: `array('q')` for INTEGER columns,
+    /// `array('d')` for REAL columns, a list otherwise. Typed columns can
+    /// be wrapped without copying, e.g. `numpy.frombuffer(col, 'int64')`.
+    /// 
+    /// An empty result still yields one (empty) list per selected column,
+    /// so `ids, names = db.query_columns(...)` works on an empty table.
+    fn query_columns<'py>(&self, py: Python<'py>, sql: String) -> PyResult<Bound<'py, PyList>> {
+        let (result, column_count) = py.allow_threads(|| {
+            let statement = self.prepare_cached(&sql)?;
+            let result = self.run_statement(Statement::clone(&statement))?;
+            let column_count = match (result.rows.first(), &*statement) {
+                (Some(row), _) => row.len(),
+                (None, Statement::Select(select)) => lock(&self.sql)?.result_width(select).map_err(to_pyerr)?,
+                (None, _) => 0,
+            };
+            Ok::<_, PyErr>((result, column_count))
+        })?;
+        
+        let array_type = py.import_bound("array")?.getattr("array")?;
+        let columns = (0..column_count)
+            .map(|col| column_to_object(py, &array_type, &result.rows, col))
+            .collect::<PyResult<Vec<_>>>()?;
+        Ok(PyList::new_bound(py, columns))
+    }
+    
+    /// Parse a statement once for repeated execution
+    fn prepare(&self, py: Python<'_>, sql: String) -> PyResult<PreparedStatement> {
+        let statement = py.allow_threads(|| parse_sql(&sql))?;
+        Ok(PreparedStatement {
+            sql,
+            statement: Arc::new(statement),
+        })
+    }
+    
+    /// Execute a prepared statement and return number of affected rows
+    fn execute_prepared(&self, py: Python<'_>, stmt: &PreparedStatement) -> PyResult<usize> {
+        py.allow_threads(|| Ok(self.run_statement(Statement::clone(&stmt.statement))?.rows_affected))
+    }
+    
+    /// Execute a prepared query and return all rows as a list of tuples
+    fn query_prepared<'py>(&self, py: Python<'py>, stmt: &PreparedStatement) -> PyResult<Bound<'py, PyList>> {
+        let result = py.allow_threads(|| self.run_statement(Statement::clone(&stmt.statement)))?;
+        Ok(rows_to_list(py, &result.rows))
+    }
+    
+    /// Begin a transaction
+    fn begin_transaction(&self, py: Python<'_>) -> PyResult<()> {
+        py.allow_threads(|| self.engine()?.begin_transaction().map_err(to_pyerr))
     }
     
     /// Begin a transaction
-    fn begin_transaction(&mut self) -> PyResult<()> {
-        self.engine.begin_transaction().map_err(to_pyerr)
+    fn begin(&self, py: Python<'_>) -> PyResult<()> {
+        self.begin_transaction(py)
     }
     
     /// Commit the current transaction
-    fn commit(&mut self) -> PyResult<()> {
-        self.engine.commit_transaction().map_err(to_pyerr)
+    fn commit(&self, py: Python<'_>) -> PyResult<()> {
+        py.allow_threads(|| self.engine()?.commit_transaction().map_err(to_pyerr))
     }
     
     /// Rollback the current transaction
-    fn rollback(&mut self) -> PyResult<()> {
-        self.engine.rollback_transaction().map_err(to_pyerr)
+    fn rollback(&self, py: Python<'_>) -> PyResult<()> {
+        py.allow_threads(|| self.engine()?.rollback_transaction().map_err(to_pyerr))
+    }
+    
+    /// Start a transaction block: `with db.transaction(): ...`
+    /// 
+    /// Commits when the block exits normally, rolls back if it raised.
+    fn transaction(slf: &Bound<'_, Self>) -> Transaction {
+        Transaction {
+            db: slf.clone().unbind(),
+        }
+    }
+    
+    /// Insert many (bytes, bytes) pairs, committing once
+    fn insert_many(&self, py: Python<'_>, records: &Bound<'_, PyList>) -> PyResult<usize> {
+        let records = records_from_list(records)?;
+        py.allow_threads(|| self.engine()?.insert_many(records).map_err(to_pyerr))
     }
     
     /// Insert a key-value pair
-    fn insert(&mut self, key: Vec<u8>, value: Vec<u8>) -> PyResult<()> {
-        let record = Record::new(key.clone(), vec![crate::storage::record::Value::Blob(value)]);
-        self.engine.insert(record).map_err(to_pyerr)
+    /// 
+    /// Key and value are borrowed straight from `bytes` (a `bytearray` is
+    /// copied once), never converted element by element.
+    fn insert(&self, py: Python<'_>, key: Cow<'_, [u8]>, value: Cow<'_, [u8]>) -> PyResult<()> {
+        let record = blob_record(&key, &value);
+        py.allow_threads(|| self.engine()?.insert(record).map_err(to_pyerr))
     }
     
-    /// Search for a key
-    fn search(&mut self, key: Vec<u8>) -> PyResult<Option<Vec<u8>>> {
-        match self.engine.search(&key) {
-            Ok(record) => Ok(Some(record.key)),
-            Err(RustError::NotFound) => Ok(None),
-            Err(e) => Err(to_pyerr(e)),
-        }
+    /// Search for a key, returning its value or None
+    fn search(&self, py: Python<'_>, key: Cow<'_, [u8]>) -> PyResult<Option<Py<PyBytes>>> {
+        Ok(self
+            .lookup(py, &key)?
+            .map(|record| PyBytes::new_bound(py, kv_payload(&record)).unbind()))
     }
     
     /// Delete a key
-    fn delete(&mut self, key: Vec<u8>) -> PyResult<()> {
-        self.engine.delete(&key).map_err(to_pyerr)
+    fn delete(&self, py: Python<'_>, key: Cow<'_, [u8]>) -> PyResult<()> {
+        let key: &[u8] = &key;
+        py.allow_threads(|| self.engine()?.delete(key).map_err(to_pyerr))
     }
     
-    /// Bulk load records (sorted)
-    fn bulk_load(&mut self, _records: Vec<(Vec<u8>, Vec<u8>)>) -> PyResult<usize> {
-        // Placeholder - would use bulk_load function
-        Ok(0)
+    /// Low-level key-value insert
+    fn insert_kv(&self, py: Python<'_>, key: Cow<'_, [u8]>, value: Cow<'_, [u8]>) -> PyResult<()> {
+        self.insert(py, key, value)
+    }
+    
+    /// Low-level key-value search, returning the stored value or None
+    fn search_kv(&self, py: Python<'_>, key: Cow<'_, [u8]>) -> PyResult<Option<Py<PyBytes>>> {
+        self.search(py, key)
+    }
+    
+    /// Search for a key, copying its value into a caller-owned bytearray
+    /// 
+    /// `out` is grown if it is too small, never shrunk. Returns the number
+    /// of bytes written (read them as `out[:n]`), or None if not found.
+    fn search_kv_into(
+        &self,
+        py: Python<'_>,
+        key: Cow<'_, [u8]>,
+        out: &Bound<'_, PyByteArray>,
+    ) -> PyResult<Option<usize>> {
+        let record = match self.lookup(py, &key)? {
+            Some(record) => record,
+            None => return Ok(None),
+        };
+        let found = kv_payload(&record);
+        
+        if out.len() < found.len() {
+            out.resize(found.len())?;
+        }
+        // SAFETY: the GIL is held and no Python code runs while the slice
+        // is alive, so the bytearray cannot be resized underneath it.
+        unsafe {
+            out.as_bytes_mut()[..found.len()].copy_from_slice(found);
+        }
+        Ok(Some(found.len()))
+    }
+    
+    /// Search for many keys in one call
+    /// 
+    /// Lookups run with the GIL released and share leaf pages between
+    /// neighbouring keys. Returns a list aligned with `keys`, holding the
+    /// stored value (bytes) or None for each key. Keys may be bytes or
+    /// bytearray, like every other key argument.
+    fn search_kv_many<'py>(
+        &self,
+        py: Python<'py>,
+        keys: Vec<Bound<'py, PyAny>>,
+    ) -> PyResult<Bound<'py, PyList>> {
+        // Cow<[u8]> borrows from its source object, so it can't be the Vec
+        // element type directly; extract each key against the owned handles
+        let keys: Vec<Cow<'_, [u8]>> = keys.iter().map(|key| key.extract()).collect::<PyResult<_>>()?;
+        let key_slices: Vec<&[u8]> = keys.iter().map(|key| key.as_ref()).collect();
+        let found = py.allow_threads(|| self.engine()?.search_many(&key_slices).map_err(to_pyerr))?;
+        
+        Ok(PyList::new_bound(
+            py,
+            found
+                .iter()
+                .map(|record| record.as_ref().map(|record| PyBytes::new_bound(py, kv_payload(record)))),
+        ))
+    }
+    
+    /// Low-level key-value delete
+    fn delete_kv(&self, py: Python<'_>, key: Cow<'_, [u8]>) -> PyResult<()> {
+        self.delete(py, key)
+    }
+    
+    /// Bulk load records from a list of (bytes, bytes) tuples
+    fn bulk_load(&self, py: Python<'_>, records: &Bound<'_, PyList>) -> PyResult<usize> {
+        let records = records_from_list(records)?;
+        py.allow_threads(|| self.engine()?.bulk_load(records).map_err(to_pyerr))
+    }
+    
+    /// Bulk load records from packed buffers
+    /// 
+    /// `keys`/`values` hold the concatenated bytes; the offset arrays are
+    /// `array('Q')` (or any uint64 buffer) with N+1 entries each.
+    fn bulk_load_buffers(
+        &self,
+        py: Python<'_>,
+        keys: &[u8],
+        key_offsets: PyBuffer<u64>,
+        values: &[u8],
+        value_offsets: PyBuffer<u64>,
+    ) -> PyResult<usize> {
+        let key_offsets = key_offsets.to_vec(py)?;
+        let value_offsets = value_offsets.to_vec(py)?;
+        let records = records_from_buffers(keys, &key_offsets, values, &value_offsets)?;
+        py.allow_threads(|| self.engine()?.bulk_load(records).map_err(to_pyerr))
+    }
+    
+    /// Bulk load records from two fixed-width uint8 matrices
+    /// 
+    /// `keys` has shape (N, key_width) and `values` shape (N, value_width),
+    /// e.g. NumPy `uint8` arrays. Each buffer is copied out in one piece
+    /// instead of creating a Python object per record.
+    fn bulk_load_numpy(
+        &self,
+        py: Python<'_>,
+        keys: PyBuffer<u8>,
+        values: PyBuffer<u8>,
+    ) -> PyResult<usize> {
+        let (key_rows, key_width) = matrix_shape(&keys, "keys")?;
+        let (value_rows, value_width) = matrix_shape(&values, "values")?;
+        if key_rows != value_rows {
+            return Err(PyValueError::new_err(format!(
+                "keys has {} rows but values has {}", key_rows, value_rows
+            )));
+        }
+        
+        let keys = keys.to_vec(py)?;
+        let values = values.to_vec(py)?;
+        py.allow_threads(|| {
+            let records = keys
+                .chunks_exact(key_width)
+                .zip(values.chunks_exact(value_width))
+                .map(|(key, value)| blob_record(key, value))
+                .collect();
+            self.engine()?.bulk_load(records).map_err(to_pyerr)
+        })
+    }
+    
+    /// Set when commits fsync: "OFF", "NORMAL" or "FULL" (default)
+    /// 
+    /// FULL and NORMAL sync the WAL on every commit; NORMAL leaves the
+    /// database file unsynced until the next checkpoint and relies on WAL
+    /// recovery instead. OFF never syncs, so an OS crash or power loss can
+    /// lose or corrupt recent commits. A common pattern is OFF for a bulk
+    /// load, then back to FULL and checkpoint().
+    fn set_synchronous(&self, py: Python<'_>, mode: &str) -> PyResult<()> {
+        let mode: SyncMode = mode
+            .parse()
+            .map_err(|e: RustError| PyValueError::new_err(e.to_string()))?;
+        self.with_engine(py, |engine| {
+            engine.set_sync_mode(mode);
+            Ok(())
+        })
+    }
+    
+    /// Current synchronous mode name
+    #[getter]
+    fn synchronous(&self, py: Python<'_>) -> PyResult<&'static str> {
+        self.with_engine(py, |engine| {
+            Ok(match engine.sync_mode() {
+                SyncMode::Off => "OFF",
+                SyncMode::Normal => "NORMAL",
+                SyncMode::Full => "FULL",
+            })
+        })
+    }
+    
+    /// Copy WAL frames into the database file and truncate the WAL
+    /// 
+    /// Returns the number of pages written.
+    fn checkpoint(&self, py: Python<'_>) -> PyResult<usize> {
+        py.allow_threads(|| self.engine()?.checkpoint().map_err(to_pyerr))
     }
     
     /// Collect statistics for a table
-    fn collect_statistics(&mut self, table: String) -> PyResult<()> {
-        self.stats_manager
-            .collect_stats_for_table(table, 0.1)
-            .map_err(to_pyerr)
+    fn collect_statistics(&self, py: Python<'_>, table: String) -> PyResult<()> {
+        py.allow_threads(|| {
+            lock(&self.stats_manager)?
+                .collect_stats_for_table(table, 0.1)
+                .map_err(to_pyerr)
+        })
     }
     
     /// Get cache statistics
     fn get_cache_stats(&self) -> PyResult<CacheStats> {
-        let stats = self.plan_cache.stats();
+        let stats = lock(&self.plan_cache)?.stats();
         Ok(CacheStats {
             size: stats.size,
             hits: stats.hits,
@@ -120,15 +836,46 @@ impl Database {
         })
     }
     
-    /// Clear the plan cache
-    fn clear_cache(&mut self) {
-        self.plan_cache.invalidate_all();
+    /// Clear the plan cache and the cached statements
+    fn clear_cache(&self) -> PyResult<()> {
+        self.invalidate_caches()
     }
     
     /// Close the database
-    fn close(&mut self) -> PyResult<()> {
-        // Cleanup
-        Ok(())
+    /// 
+    /// Rolls back an open transaction, flushes the WAL to the database
+    /// file and drops the engine, releasing its file locks so the path can
+    /// be opened again. Later calls on this connection raise; closing twice
+    /// is a no-op.
+    fn close(&self, py: Python<'_>) -> PyResult<()> {
+        if self.closed.swap(true, Ordering::AcqRel) {
+            return Ok(());
+        }
+        
+        py.allow_threads(|| {
+            let Some(mut engine) = lock(&self.engine)?.take() else {
+                return Ok(());
+            };
+            if engine.in_transaction() {
+                engine.rollback_transaction().map_err(to_pyerr)?;
+            }
+            engine.flush().map_err(to_pyerr)
+        })
+    }
+    
+    /// Whether a transaction is currently open
+    #[getter]
+    fn in_transaction(&self, py: Python<'_>) -> PyResult<bool> {
+        if self.closed.load(Ordering::Acquire) {
+            return Ok(false);
+        }
+        self.with_engine(py, |engine| Ok(engine.in_transaction()))
+    }
+    
+    /// Whether close() has been called
+    #[getter]
+    fn closed(&self) -> bool {
+        self.closed.load(Ordering::Acquire)
     }
     
     /// Context manager support - enter
@@ -137,20 +884,81 @@ impl Database {
     }
     
     /// Context manager support - exit
+    /// 
+    /// Closes the database, rolling back any transaction left open.
     #[pyo3(signature = (_exc_type=None, _exc_value=None, _traceback=None))]
     fn __exit__(
-        &mut self,
+        &self,
+        py: Python<'_>,
         _exc_type: Option<Bound<'_, PyAny>>,
         _exc_value: Option<Bound<'_, PyAny>>,
         _traceback: Option<Bound<'_, PyAny>>,
     ) -> PyResult<bool> {
-        self.close()?;
+        self.close(py)?;
         Ok(false)
     }
     
     /// String representation
     fn __repr__(&self) -> String {
-        "Database()".to_string()
+        format!("Database('{}')", self.path)
+    }
+}
+
+/// Context manager returned by `Database.transaction()`
+#[cfg(feature = "python")]
+#[pyclass]
+pub struct Transaction {
+    db: Py<Database>,
+}
+
+#[cfg(feature = "python")]
+#[pymethods]
+impl Transaction {
+    /// Begin the transaction and return the database
+    fn __enter__(&self, py: Python<'_>) -> PyResult<Py<Database>> {
+        self.db.borrow(py).begin_transaction(py)?;
+        Ok(self.db.clone_ref(py))
+    }
+    
+    /// Commit, or roll back if the block raised
+    #[pyo3(signature = (exc_type=None, _exc_value=None, _traceback=None))]
+    fn __exit__(
+        &self,
+        py: Python<'_>,
+        exc_type: Option<Bound<'_, PyAny>>,
+        _exc_value: Option<Bound<'_, PyAny>>,
+        _traceback: Option<Bound<'_, PyAny>>,
+    ) -> PyResult<bool> {
+        let db = self.db.borrow(py);
+        if exc_type.is_some() {
+            db.rollback(py)?;
+        } else {
+            db.commit(py)?;
+        }
+        Ok(false)
+    }
+}
+
+/// Parsed SQL statement, shareable across threads
+#[cfg(feature = "python")]
+#[pyclass(frozen)]
+pub struct PreparedStatement {
+    sql: String,
+    statement: Arc<Statement>,
+}
+
+#[cfg(feature = "python")]
+#[pymethods]
+impl PreparedStatement {
+    /// Original SQL text
+    #[getter]
+    fn sql(&self) -> &str {
+        &self.sql
+    }
+    
+    /// String representation
+    fn __repr__(&self) -> String {
+        format!("PreparedStatement({:?})", self.sql)
     }
 }
 
@@ -179,13 +987,7 @@ impl PyValue {
     
     /// Convert to Python object
     fn to_python(&self, py: Python) -> PyResult<PyObject> {
-        match &self.inner {
-            Value::Null => Ok(py.None()),
-            Value::Integer(i) => Ok(i.to_object(py)),
-            Value::Real(f) => Ok(f.to_object(py)),
-            Value::Text(s) => Ok(s.to_object(py)),
-            Value::Blob(b) => Ok(b.to_object(py)),
-        }
+        Ok(value_to_object(py, &self.inner))
     }
     
     /// String representation
@@ -228,6 +1030,8 @@ impl CacheStats {
 #[pymodule]
 fn _deepsql(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<Database>()?;
+    m.add_class::<PreparedStatement>()?;
+    m.add_class::<Transaction>()?;
     m.add_class::<PyValue>()?;
     m.add_class::<CacheStats>()?;
     
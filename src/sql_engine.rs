@@ -25,37 +25,25 @@ use crate::vm::opcode::Program;
 /// Coordinates the entire SQL execution pipeline from
 /// raw SQL string to query results.
 pub struct SqlEngine {
-    /// Catalog manager for schema metadata
-    catalog: CatalogManager,
-    
     /// Storage pager
     pager: Pager,
     
-    /// Query optimizer
-    optimizer: Optimizer,
-    
-    /// Transaction state
-    in_transaction: bool,
-    
-    /// Buffered statements in transaction
-    transaction_buffer: Vec<String>,
+    /// Catalog, optimizer and transaction state
+    session: SqlSession,
 }
 
 impl SqlEngine {
     /// Create a new SQL engine
     pub fn new(pager: Pager) -> Self {
         SqlEngine {
-            catalog: CatalogManager::new(),
             pager,
-            optimizer: Optimizer::new(),
-            in_transaction: false,
-            transaction_buffer: Vec::new(),
+            session: SqlSession::new(),
         }
     }
     
     /// Load catalog from database
     pub fn load_catalog(&mut self) -> Result<()> {
-        self.catalog.load(&mut self.pager)
+        self.session.catalog.load(&mut self.pager)
     }
     
     /// Execute a SQL statement
@@ -79,22 +67,77 @@ impl SqlEngine {
         let mut parser = Parser::new(tokens);
         let statement = parser.parse_statement()?;
         
-        // Step 2: Route to appropriate handler
+        // Step 2: Plan and run it
+        self.session.execute_statement(&mut self.pager, statement)
+    }
+}
+
+/// SQL execution state without a pager of its own
+/// 
+/// Runs already-parsed statements against a borrowed pager, so callers that
+/// own the pager elsewhere (e.g. the `Engine` behind the Python bindings)
+/// can execute SQL and cache parsed statements.
+pub struct SqlSession {
+    /// Catalog manager for schema metadata
+    catalog: CatalogManager,
+    
+    /// Query optimizer
+    optimizer: Optimizer,
+    
+    /// Transaction state
+    in_transaction: bool,
+    
+    /// Buffered statements in transaction
+    transaction_buffer: Vec<String>,
+}
+
+impl SqlSession {
+    /// Create a session with an empty catalog
+    pub fn new() -> Self {
+        SqlSession {
+            catalog: CatalogManager::new(),
+            optimizer: Optimizer::new(),
+            in_transaction: false,
+            transaction_buffer: Vec::new(),
+        }
+    }
+    
+    /// Execute a parsed SQL statement against `pager`
+    pub fn execute_statement(&mut self, pager: &mut Pager, statement: Statement) -> Result<QueryResult> {
         match statement {
-            Statement::Select(select) => self.execute_select(select),
-            Statement::Insert(insert) => self.execute_insert(insert),
-            Statement::Update(update) => self.execute_update(update),
-            Statement::Delete(delete) => self.execute_delete(delete),
-            Statement::CreateTable(create) => self.execute_create_table(create),
-            Statement::CreateIndex(idx) => self.execute_create_index(idx),
+            Statement::Select(select) => self.execute_select(pager, select),
+            Statement::Insert(insert) => self.execute_insert(pager, insert),
+            Statement::Update(update) => self.execute_update(pager, update),
+            Statement::Delete(delete) => self.execute_delete(pager, delete),
+            Statement::CreateTable(create) => self.execute_create_table(pager, create),
+            Statement::CreateIndex(idx) => self.execute_create_index(pager, idx),
             Statement::Begin => self.execute_begin(),
             Statement::Commit => self.execute_commit(),
             Statement::Rollback => self.execute_rollback(),
         }
     }
     
+    /// Number of columns a SELECT returns, from its projection and the catalog
+    /// 
+    /// An empty result has no row to count, so callers that shape output
+    /// by column use this instead.
+    pub fn result_width(&self, select: &crate::sql::ast::SelectStatement) -> Result<usize> {
+        use crate::sql::ast::SelectColumn;
+        
+        select.columns.iter().map(|column| match column {
+            SelectColumn::Star => {
+                let table_name = select.from.as_deref()
+                    .ok_or_else(|| Error::InvalidArgument("SELECT * requires a FROM clause".to_string()))?;
+                self.catalog.get_table(table_name)
+                    .map(|schema| schema.columns.len())
+                    .ok_or_else(|| Error::TableNotFound(table_name.to_string()))
+            }
+            SelectColumn::Expr { .. } => Ok(1),
+        }).sum()
+    }
+    
     /// Execute SELECT statement
-    fn execute_select(&mut self, select: crate::sql::ast::SelectStatement) -> Result<QueryResult> {
+    fn execute_select(&mut self, pager: &mut Pager, select: crate::sql::ast::SelectStatement) -> Result<QueryResult> {
         // Step 1: Build logical plan from AST
         let statement = Statement::Select(select);
         let mut logical_plan = PlanBuilder::new().build(statement)?;
@@ -114,7 +157,7 @@ impl SqlEngine {
         // Step 5: Execute VM program with table schemas
         let mut executor = Executor::new();
         let table_schemas = self.get_table_schemas();
-        executor.execute(&program, &mut self.pager, &table_schemas)
+        executor.execute(&program, pager, &table_schemas)
     }
     
     /// Expand SELECT * wildcards to actual column names
@@ -206,7 +249,7 @@ impl SqlEngine {
     }
     
     /// Execute INSERT statement with constraint validation and auto-increment
-    fn execute_insert(&mut self, mut insert: crate::sql::ast::InsertStatement) -> Result<QueryResult> {
+    fn execute_insert(&mut self, pager: &mut Pager, mut insert: crate::sql::ast::InsertStatement) -> Result<QueryResult> {
         use crate::sql::ast::{Expr, Literal};
         
         #[cfg(test)]
@@ -315,7 +358,7 @@ impl SqlEngine {
             updated_schema.last_insert_id = last_id;
             self.catalog.update_table(updated_schema)?;
             // Save catalog to persist the change
-            self.catalog.save(&mut self.pager)?;
+            self.catalog.save(pager)?;
         }
         
         // Replace original values with processed rows
@@ -334,16 +377,16 @@ impl SqlEngine {
         // Step 6: Execute with table schemas
         let mut executor = Executor::new();
         let table_schemas = self.get_table_schemas();
-        let result = executor.execute(&program, &mut self.pager, &table_schemas)?;
+        let result = executor.execute(&program, pager, &table_schemas)?;
         
         // Step 7: Validate UNIQUE constraints after insert
-        self.validate_unique_constraints(&table_name, &table_schema)?;
+        self.validate_unique_constraints(pager, &table_name, &table_schema)?;
         
         Ok(QueryResult::with_affected(result.rows_affected))
     }
     
     /// Validate UNIQUE constraints for a table
-    fn validate_unique_constraints(&mut self, table_name: &str, table_schema: &crate::catalog::schema::TableSchema) -> Result<()> {
+    fn validate_unique_constraints(&mut self, pager: &mut Pager, table_name: &str, table_schema: &crate::catalog::schema::TableSchema) -> Result<()> {
         use crate::storage::btree::BTree;
         use std::collections::HashSet;
         
@@ -356,10 +399,10 @@ impl SqlEngine {
             // Scan table and collect values for this column
             let mut values_seen = HashSet::new();
             let btree = BTree::open(table_schema.root_page)?;
-            let mut cursor = crate::storage::btree::Cursor::new(&mut self.pager, btree.root_page_id())?;
+            let mut cursor = crate::storage::btree::Cursor::new(pager, btree.root_page_id())?;
             
             loop {
-                match cursor.current(&mut self.pager) {
+                match cursor.current(pager) {
                     Ok(record) => {
                         if col_idx < record.values.len() {
                             // Convert to string for comparison (simple approach)
@@ -375,7 +418,7 @@ impl SqlEngine {
                         }
                         
                         // Move to next record
-                        if cursor.next(&mut self.pager).is_err() {
+                        if cursor.next(pager).is_err() {
                             break;
                         }
                     }
@@ -399,7 +442,7 @@ impl SqlEngine {
     }
     
     /// Execute UPDATE statement
-    fn execute_update(&mut self, update: crate::sql::ast::UpdateStatement) -> Result<QueryResult> {
+    fn execute_update(&mut self, pager: &mut Pager, update: crate::sql::ast::UpdateStatement) -> Result<QueryResult> {
         // Step 1: Build logical plan
         let statement = Statement::Update(update);
         let logical_plan = PlanBuilder::new().build(statement)?;
@@ -416,13 +459,13 @@ impl SqlEngine {
         // Step 5: Execute
         let mut executor = Executor::new();
         let table_schemas = self.get_table_schemas();
-        let result = executor.execute(&program, &mut self.pager, &table_schemas)?;
+        let result = executor.execute(&program, pager, &table_schemas)?;
         
         Ok(QueryResult::with_affected(result.rows_affected))
     }
     
     /// Execute DELETE statement
-    fn execute_delete(&mut self, delete: crate::sql::ast::DeleteStatement) -> Result<QueryResult> {
+    fn execute_delete(&mut self, pager: &mut Pager, delete: crate::sql::ast::DeleteStatement) -> Result<QueryResult> {
         // Step 1: Build logical plan
         let statement = Statement::Delete(delete);
         let logical_plan = PlanBuilder::new().build(statement)?;
@@ -439,24 +482,24 @@ impl SqlEngine {
         // Step 5: Execute
         let mut executor = Executor::new();
         let table_schemas = self.get_table_schemas();
-        let result = executor.execute(&program, &mut self.pager, &table_schemas)?;
+        let result = executor.execute(&program, pager, &table_schemas)?;
         
         Ok(QueryResult::with_affected(result.rows_affected))
     }
     
     /// Execute CREATE INDEX statement
-    fn execute_create_index(&mut self, idx: crate::sql::ast::CreateIndexStatement) -> Result<QueryResult> {
+    fn execute_create_index(&mut self, pager: &mut Pager, idx: crate::sql::ast::CreateIndexStatement) -> Result<QueryResult> {
         // Create index in catalog
         self.catalog.create_index(
             idx.name.clone(),
             idx.table.clone(),
             idx.columns.clone(),
             idx.unique,
-            &mut self.pager,
+            pager,
         )?;
         
         // Save catalog
-        self.catalog.save(&mut self.pager)?;
+        self.catalog.save(pager)?;
         
         eprintln!("✅ Index '{}' created on table '{}' for columns {:?}", 
                   idx.name, idx.table, idx.columns);
@@ -526,13 +569,13 @@ impl SqlEngine {
     }
     
     /// Execute CREATE TABLE statement
-    fn execute_create_table(&mut self, create: crate::sql::ast::CreateTableStatement) -> Result<QueryResult> {
+    fn execute_create_table(&mut self, pager: &mut Pager, create: crate::sql::ast::CreateTableStatement) -> Result<QueryResult> {
         // Step 1: Convert AST to LogicalPlan
         let statement = Statement::CreateTable(create);
         let logical_plan = PlanBuilder::new().build(statement)?;
         
         // Step 2: Execute via catalog manager
-        self.catalog.create_table(&logical_plan, &mut self.pager)?;
+        self.catalog.create_table(&logical_plan, pager)?;
         
         // Step 3: Return success
         Ok(QueryResult::with_affected(0))
@@ -637,6 +680,24 @@ mod tests {
     use super::*;
     use tempfile::tempdir;
     
+    #[test]
+    fn test_result_width() {
+        let dir = tempdir().unwrap();
+        let mut pager = Pager::open(dir.path().join("test.db")).unwrap();
+        let mut session = SqlSession::new();
+        
+        let parse = |sql: &str| Parser::new(Lexer::new(sql).tokenize()).parse_statement().unwrap();
+        session.execute_statement(&mut pager, parse("CREATE TABLE t (id INTEGER, name TEXT, score REAL)")).unwrap();
+        
+        let width = |session: &SqlSession, sql: &str| match parse(sql) {
+            Statement::Select(select) => session.result_width(&select),
+            _ => unreachable!(),
+        };
+        assert_eq!(width(&session, "SELECT * FROM t").unwrap(), 3);
+        assert_eq!(width(&session, "SELECT name, id FROM t").unwrap(), 2);
+        assert!(matches!(width(&session, "SELECT * FROM missing"), Err(Error::TableNotFound(_))));
+    }
+    
     #[test]
     fn test_sql_engine_creation() {
         let dir = tempdir().unwrap();
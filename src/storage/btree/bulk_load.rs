@@ -31,6 +31,7 @@ impl Default for BulkLoadConfig {
 /// Bulk load records into a B+Tree
 /// 
 /// Records MUST be sorted by key (ascending order)
+/// Replaces the tree's existing records; an empty load leaves it empty.
 /// Returns the number of records loaded
 pub fn bulk_load(
     btree: &mut BTree,
@@ -38,10 +39,6 @@ pub fn bulk_load(
     records: Vec<Record>,
     config: &BulkLoadConfig,
 ) -> Result<usize> {
-    if records.is_empty() {
-        return Ok(0);
-    }
-    
     // Validate that records are sorted
     if !is_sorted(&records) {
         return Err(Error::InvalidArgument(
@@ -51,6 +48,11 @@ pub fn bulk_load(
     
     let record_count = records.len();
     
+    // Release the pages of the tree being replaced so the new tree reuses them
+    for page_id in collect_tree_pages(pager, btree.root_page_id())? {
+        pager.free_page(page_id)?;
+    }
+    
     // Build leaf level first
     let leaf_nodes = build_leaf_level(pager, records, config)?;
     
@@ -74,19 +76,41 @@ fn is_sorted(records: &[Record]) -> bool {
     true
 }
 
+/// All page IDs of the tree rooted at `root_id`
+fn collect_tree_pages(pager: &mut Pager, root_id: PageId) -> Result<Vec<PageId>> {
+    let mut pages = Vec::new();
+    let mut pending = vec![root_id];
+    
+    while let Some(page_id) = pending.pop() {
+        pages.push(page_id);
+        
+        let node = BTreeNode::from_page(pager.read_page(page_id)?);
+        if !node.is_leaf()? {
+            for i in 0..node.cell_count()? {
+                pending.push(node.get_interior_cell(i)?.left_child);
+            }
+            pending.push(node.right_child()?);
+        }
+    }
+    
+    Ok(pages)
+}
+
 /// Build the leaf level of the tree
+/// 
+/// Returns each leaf's page ID together with its smallest key.
 fn build_leaf_level(
     pager: &mut Pager,
     records: Vec<Record>,
     config: &BulkLoadConfig,
-) -> Result<Vec<PageId>> {
+) -> Result<Vec<(PageId, Vec<u8>)>> {
     let page_size = pager.page_size();
     let target_fill = (page_size as f32 * config.fill_factor) as usize;
     
     let mut leaf_pages = Vec::new();
-    let mut current_page = pager.allocate_page(PageType::Leaf)?;
-    let mut current_node = BTreeNode::from_page(current_page);
+    let mut current_node = BTreeNode::from_page(pager.allocate_page(PageType::Leaf)?);
     let mut current_size = 12; // Page header size
+    let mut first_key: Option<Vec<u8>> = None;
     
     for record in records {
         let cell = LeafCell {
@@ -101,14 +125,17 @@ fn build_leaf_level(
             // Write current page and start new one
             let page_id = current_node.page_id();
             pager.write_page(current_node.into_page())?;
-            leaf_pages.push(page_id);
+            leaf_pages.push((page_id, first_key.take().unwrap_or_default()));
             
             // Allocate new leaf
-            current_page = pager.allocate_page(PageType::Leaf)?;
-            current_node = BTreeNode::from_page(current_page);
+            current_node = BTreeNode::from_page(pager.allocate_page(PageType::Leaf)?);
             current_size = 12;
         }
         
+        if first_key.is_none() {
+            first_key = Some(cell.key.clone());
+        }
+        
         // Add cell to current page
         let insert_index = current_node.cell_count()?;
         current_node.insert_leaf_cell(insert_index, &cell)?;
@@ -116,111 +143,130 @@ fn build_leaf_level(
     }
     
     // Write last page
-    if current_node.cell_count()? > 0 {
-        let page_id = current_node.page_id();
-        pager.write_page(current_node.into_page())?;
-        leaf_pages.push(page_id);
-    }
+    let page_id = current_node.page_id();
+    pager.write_page(current_node.into_page())?;
+    leaf_pages.push((page_id, first_key.unwrap_or_default()));
     
     Ok(leaf_pages)
 }
 
 /// Build interior levels bottom-up
+/// 
+/// `children` holds (page ID, smallest key in subtree) in key order. Each
+/// interior cell points left to a child and carries the smallest key of the
+/// child after it, so searches for `key < separator` go left; the last child
+/// of a node becomes its right child.
 fn build_interior_levels(
     pager: &mut Pager,
-    child_pages: Vec<PageId>,
+    children: Vec<(PageId, Vec<u8>)>,
     config: &BulkLoadConfig,
 ) -> Result<PageId> {
     // If only one page, it's the root
-    if child_pages.len() == 1 {
-        return Ok(child_pages[0]);
+    if children.len() == 1 {
+        return Ok(children[0].0);
     }
     
     let page_size = pager.page_size();
     let target_fill = (page_size as f32 * config.fill_factor) as usize;
     
+    let mut children = children.into_iter();
+    let (first_child, first_key) = children.next().expect("at least two children");
+    
     // Build parent level
     let mut parent_pages = Vec::new();
-    let mut current_page = pager.allocate_page(PageType::Interior)?;
-    let mut current_node = BTreeNode::from_page(current_page);
+    let mut current_node = BTreeNode::from_page(pager.allocate_page(PageType::Interior)?);
+    let mut current_min = first_key;
     let mut current_size = 16; // Interior page header (with right child pointer)
+    let mut previous_child = first_child;
     
-    for (i, &child_id) in child_pages.iter().enumerate() {
-        // Read first key from child as separator
-        let child_page = pager.read_page(child_id)?;
-        let child_node = BTreeNode::from_page(child_page);
-        
-        let separator_key = if child_node.is_leaf()? {
-            // Get first key from leaf
-            if child_node.cell_count()? > 0 {
-                child_node.get_leaf_cell(0)?.key
-            } else {
-                continue;
-            }
-        } else {
-            // Get first key from interior node
-            if child_node.cell_count()? > 0 {
-                child_node.get_interior_cell(0)?.key
-            } else {
-                continue;
-            }
+    for (child_id, child_min) in children {
+        let cell = InteriorCell {
+            left_child: previous_child,
+            key: child_min.clone(),
         };
         
-        // For all but the last child, create interior cell
-        if i < child_pages.len() - 1 {
-            let cell = InteriorCell {
-                left_child: child_id,
-                key: separator_key,
-            };
-            
-            let cell_size = cell.serialize().len();
+        let cell_size = cell.serialize().len();
+        
+        // Check if adding this cell would exceed target fill
+        if current_size + cell_size + 2 > target_fill && current_node.cell_count()? > 0 {
+            // Close the node with the previous child as its right child
+            current_node.set_right_child(previous_child)?;
+            let page_id = current_node.page_id();
+            pager.write_page(current_node.into_page())?;
+            parent_pages.push((page_id, current_min));
             
-            // Check if adding this cell would exceed target fill
-            if current_size + cell_size + 2 > target_fill && current_node.cell_count()? > 0 {
-                // Set right child to next child_id
-                current_node.set_right_child(child_pages[i])?;
-                
-                // Write current page and start new one
-                let page_id = current_node.page_id();
-                pager.write_page(current_node.into_page())?;
-                parent_pages.push(page_id);
-                
-                // Allocate new interior node
-                current_page = pager.allocate_page(PageType::Interior)?;
-                current_node = BTreeNode::from_page(current_page);
-                current_size = 16;
-                
-                // Add the child we skipped
-                let insert_index = current_node.cell_count()?;
-                current_node.insert_interior_cell(insert_index, &cell)?;
-                current_size += cell_size + 2;
-            } else {
-                // Add cell to current page
-                let insert_index = current_node.cell_count()?;
-                current_node.insert_interior_cell(insert_index, &cell)?;
-                current_size += cell_size + 2;
-            }
+            // Start a new interior node whose leftmost child is this one
+            current_node = BTreeNode::from_page(pager.allocate_page(PageType::Interior)?);
+            current_min = child_min;
+            current_size = 16;
         } else {
-            // Last child becomes right child
-            current_node.set_right_child(child_id)?;
+            // Add cell to current page
+            let insert_index = current_node.cell_count()?;
+            current_node.insert_interior_cell(insert_index, &cell)?;
+            current_size += cell_size + 2;
         }
+        
+        previous_child = child_id;
     }
     
-    // Write last interior page
-    if current_node.cell_count()? > 0 || child_pages.len() == 1 {
-        let page_id = current_node.page_id();
-        pager.write_page(current_node.into_page())?;
-        parent_pages.push(page_id);
-    }
+    // Last child becomes right child of the last interior page
+    current_node.set_right_child(previous_child)?;
+    let page_id = current_node.page_id();
+    pager.write_page(current_node.into_page())?;
+    parent_pages.push((page_id, current_min));
     
     // Recursively build next level
     build_interior_levels(pager, parent_pages, config)
 }
 
 /// Sort records by key (helper for unsorted input)
-pub fn sort_records(mut records: Vec<Record>) -> Vec<Record> {
-    records.sort_by(|a, b| a.key.cmp(&b.key));
-    records
+/// 
+/// Compares a cached big-endian 8-byte key prefix first and only falls
+/// back to the full key on ties, which avoids chasing key pointers for
+/// most comparisons. The sort is stable, so equal keys keep input order.
+pub fn sort_records(records: Vec<Record>) -> Vec<Record> {
+    let mut keyed: Vec<(u64, Record)> = records
+        .into_iter()
+        .map(|record| (key_prefix(&record.key), record))
+        .collect();
+    keyed.sort_by(|a, b| a.0.cmp(&b.0).then_with(|| a.1.key.cmp(&b.1.key)));
+    keyed.into_iter().map(|(_, record)| record).collect()
+}
+
+/// First 8 key bytes as a big-endian integer (zero-padded)
+/// 
+/// Ordering by prefix agrees with byte-wise key ordering whenever the
+/// prefixes differ.
+fn key_prefix(key: &[u8]) -> u64 {
+    let mut prefix = [0u8; 8];
+    let len = key.len().min(8);
+    prefix[..len].copy_from_slice(&key[..len]);
+    u64::from_be_bytes(prefix)
+}
+
+/// Drop duplicate keys from sorted records, keeping the last occurrence
+pub fn dedup_sorted_records(records: Vec<Record>) -> Vec<Record> {
+    let mut deduped: Vec<Record> = Vec::with_capacity(records.len());
+    for record in records {
+        match deduped.last_mut() {
+            Some(last) if last.key == record.key => *last = record,
+            _ => deduped.push(record),
+        }
+    }
+    deduped
+}
+
+/// Prepare arbitrary input for bulk loading
+/// 
+/// Sorts unless the input is already sorted, then removes duplicate keys
+/// (last occurrence wins, as with sequential inserts overwriting).
+pub fn sort_and_dedup(records: Vec<Record>) -> Vec<Record> {
+    let records = if is_sorted(&records) {
+        records
+    } else {
+        sort_records(records)
+    };
+    dedup_sorted_records(records)
 }
 
 #[cfg(test)]
@@ -256,6 +302,30 @@ mod tests {
         }
     }
     
+    #[test]
+    fn test_bulk_load_multi_level_search() {
+        let temp_file = NamedTempFile::new().unwrap();
+        let mut pager = Pager::open(temp_file.path()).unwrap();
+        let mut btree = BTree::new(&mut pager).unwrap();
+        
+        // Small fill factor forces many leaves and two interior levels
+        let records: Vec<Record> = (0..3000)
+            .map(|i| Record::new(format!("key_{:05}", i).into_bytes(), vec![Value::Integer(i)]))
+            .collect();
+        let config = BulkLoadConfig { fill_factor: 0.2, ..BulkLoadConfig::default() };
+        bulk_load(&mut btree, &mut pager, records, &config).unwrap();
+        
+        let root = BTreeNode::from_page(pager.read_page(btree.root_page_id()).unwrap());
+        let child = root.get_interior_cell(0).unwrap().left_child;
+        assert!(!BTreeNode::from_page(pager.read_page(child).unwrap()).is_leaf().unwrap());
+        
+        for i in 0..3000 {
+            let key = format!("key_{:05}", i).into_bytes();
+            let found = btree.search(&mut pager, &key).unwrap();
+            assert_eq!(found.values[0], Value::Integer(i));
+        }
+    }
+    
     #[test]
     fn test_bulk_load_unsorted_error() {
         let temp_file = NamedTempFile::new().unwrap();
@@ -289,6 +359,35 @@ mod tests {
         assert!(is_sorted(&sorted));
     }
     
+    #[test]
+    fn test_sort_records_long_keys() {
+        // Keys sharing an 8-byte prefix must be ordered by the full key
+        let keys: Vec<&[u8]> = vec![&b"prefix__b"[..], &b"prefix__a"[..], &b"pre"[..], &b"prefix__"[..], &b"a"[..]];
+        let records = keys
+            .iter()
+            .map(|k| Record::new(k.to_vec(), vec![Value::Null]))
+            .collect();
+        
+        let sorted = sort_records(records);
+        let sorted_keys: Vec<&[u8]> = sorted.iter().map(|r| r.key.as_slice()).collect();
+        let expected: Vec<&[u8]> = vec![&b"a"[..], &b"pre"[..], &b"prefix__"[..], &b"prefix__a"[..], &b"prefix__b"[..]];
+        assert_eq!(sorted_keys, expected);
+    }
+    
+    #[test]
+    fn test_sort_and_dedup_keeps_last() {
+        let records = vec![
+            Record::new(vec![2], vec![Value::Integer(1)]),
+            Record::new(vec![1], vec![Value::Integer(2)]),
+            Record::new(vec![2], vec![Value::Integer(3)]),
+        ];
+        
+        let prepared = sort_and_dedup(records);
+        assert_eq!(prepared.len(), 2);
+        assert_eq!(prepared[0].key, vec![1]);
+        assert_eq!(prepared[1].values[0], Value::Integer(3));
+    }
+    
     #[test]
     fn test_bulk_load_small_dataset() {
         // Test with smaller dataset to verify basic functionality
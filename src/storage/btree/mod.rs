@@ -81,6 +81,11 @@ impl BTree {
         search::search(self, pager, key)
     }
     
+    /// Search for many keys, returning results in input order
+    pub fn search_many(&self, pager: &mut Pager, keys: &[&[u8]]) -> Result<Vec<Option<Record>>> {
+        search::search_many(self, pager, keys)
+    }
+    
     /// Create a cursor for scanning the B+Tree
     pub fn cursor(&self, pager: &mut Pager) -> Result<Cursor> {
         Cursor::new(pager, self.root_page_id)
@@ -25,6 +25,82 @@ pub fn search(btree: &BTree, pager: &mut Pager, key: &[u8]) -> Result<Record> {
     }
 }
 
+/// Search for many keys at once
+/// 
+/// Keys are visited in sorted order so consecutive keys that land in the
+/// same leaf reuse the already-decoded node instead of descending from the
+/// root again. Results are returned in input order.
+pub fn search_many(btree: &BTree, pager: &mut Pager, keys: &[&[u8]]) -> Result<Vec<Option<Record>>> {
+    let mut order: Vec<usize> = (0..keys.len()).collect();
+    order.sort_by(|&a, &b| keys[a].cmp(keys[b]));
+    
+    let mut results: Vec<Option<Record>> = (0..keys.len()).map(|_| None).collect();
+    
+    // Current leaf and the exclusive upper bound of its key range (None = unbounded)
+    let mut current: Option<(BTreeNode, Option<Vec<u8>>)> = None;
+    
+    for index in order {
+        let key = keys[index];
+        
+        let in_current_leaf = match &current {
+            Some((_, Some(upper))) => key < upper.as_slice(),
+            Some((_, None)) => true,
+            None => false,
+        };
+        if !in_current_leaf {
+            current = Some(find_leaf(btree, pager, key)?);
+        }
+        
+        if let Some((leaf, _)) = &current {
+            results[index] = match search_leaf(leaf, key) {
+                Ok(record) => Some(record),
+                Err(Error::NotFound) => None,
+                Err(e) => return Err(e),
+            };
+        }
+    }
+    
+    Ok(results)
+}
+
+/// Descend to the leaf that may contain `key`
+/// 
+/// Also returns the leaf's exclusive upper key bound: the separator of the
+/// nearest ancestor where the descent went left.
+fn find_leaf(btree: &BTree, pager: &mut Pager, key: &[u8]) -> Result<(BTreeNode, Option<Vec<u8>>)> {
+    let mut page_id = btree.root_page_id();
+    let mut upper = None;
+    
+    loop {
+        let page = pager.read_page(page_id)?;
+        let node = BTreeNode::from_page(page);
+        
+        if node.is_leaf()? {
+            return Ok((node, upper));
+        }
+        
+        let (child, bound) = find_child_with_bound(&node, key)?;
+        if bound.is_some() {
+            upper = bound;
+        }
+        page_id = child;
+    }
+}
+
+/// Like `find_child_page`, also returning the separator when going left
+fn find_child_with_bound(node: &BTreeNode, key: &[u8]) -> Result<(PageId, Option<Vec<u8>>)> {
+    let cell_count = node.cell_count()?;
+    
+    for i in 0..cell_count {
+        let cell = node.get_interior_cell(i)?;
+        if key < cell.key.as_slice() {
+            return Ok((cell.left_child, Some(cell.key)));
+        }
+    }
+    
+    Ok((node.right_child()?, None))
+}
+
 /// Search for key in a leaf node
 fn search_leaf(node: &BTreeNode, key: &[u8]) -> Result<Record> {
     let cell_count = node.cell_count()?;
@@ -87,6 +163,33 @@ mod tests {
         assert_eq!(found.values[0], Value::Integer(42));
     }
     
+    #[test]
+    fn test_search_many() {
+        let temp_file = NamedTempFile::new().unwrap();
+        let mut pager = Pager::open(temp_file.path()).unwrap();
+        
+        let mut btree = BTree::new(&mut pager).unwrap();
+        
+        // Enough records to split into several leaves
+        for i in 0..500u32 {
+            let key = i.to_be_bytes().to_vec();
+            btree.insert(&mut pager, Record::new(key, vec![Value::Integer(i as i64)])).unwrap();
+        }
+        
+        let wanted = [450u32, 3, 9999, 3, 250];
+        let keys: Vec<Vec<u8>> = wanted.iter().map(|k| k.to_be_bytes().to_vec()).collect();
+        let key_refs: Vec<&[u8]> = keys.iter().map(|k| k.as_slice()).collect();
+        
+        let found = search_many(&btree, &mut pager, &key_refs).unwrap();
+        assert_eq!(found.len(), wanted.len());
+        for (i, &k) in wanted.iter().enumerate() {
+            match &found[i] {
+                Some(record) => assert_eq!(record.values[0], Value::Integer(k as i64)),
+                None => assert_eq!(k, 9999),
+            }
+        }
+    }
+    
     #[test]
     fn test_search_not_found() {
         let temp_file = NamedTempFile::new().unwrap();
@@ -14,7 +14,7 @@ pub mod record;
 pub mod btree;
 
 pub use file_format::*;
-pub use pager::Pager;
+pub use pager::{Pager, SyncMode};
 pub use page::{Page, PageType, PageId};
 pub use record::{Record, Varint};
 
@@ -18,6 +18,40 @@ use std::path::{Path, PathBuf};
 /// Maximum number of pages to keep in memory cache
 const DEFAULT_CACHE_SIZE: usize = 256;
 
+/// When the pager and WAL call fsync (like SQLite's `PRAGMA synchronous`)
+#[derive(Debug, Clone, Copy, PartialEq, Eq, Default)]
+pub enum SyncMode {
+    /// Never fsync; fastest, but an OS crash or power loss can lose or
+    /// corrupt recent commits
+    Off,
+    
+    /// Fsync the WAL on every commit but the database file only at
+    /// checkpoints. Commits copy their pages into the database file right
+    /// after the WAL commit, so the synced WAL is what recovery replays if a
+    /// power loss tears those writes.
+    Normal,
+    
+    /// Like `Normal`, and also fsync the database file whenever its header
+    /// is written (default)
+    #[default]
+    Full,
+}
+
+impl std::str::FromStr for SyncMode {
+    type Err = Error;
+    
+    fn from_str(s: &str) -> Result<Self> {
+        match s.to_ascii_uppercase().as_str() {
+            "OFF" => Ok(SyncMode::Off),
+            "NORMAL" => Ok(SyncMode::Normal),
+            "FULL" => Ok(SyncMode::Full),
+            _ => Err(Error::InvalidArgument(format!(
+                "Unknown synchronous mode '{}' (expected OFF, NORMAL or FULL)", s
+            ))),
+        }
+    }
+}
+
 /// Page Manager - handles page I/O and caching
 pub struct Pager {
     /// Database file handle
@@ -46,6 +80,12 @@ pub struct Pager {
     
     /// Modified pages in transaction
     modified_pages: HashMap<PageId, Page>,
+    
+    /// Header as of the start of the transaction (restored on rollback)
+    tx_header: Option<DatabaseHeader>,
+    
+    /// When to fsync the database file
+    sync_mode: SyncMode,
 }
 
 impl Pager {
@@ -105,14 +145,27 @@ impl Pager {
             transaction_mode: false,
             shadow_pages: HashMap::new(),
             modified_pages: HashMap::new(),
+            tx_header: None,
+            sync_mode: SyncMode::default(),
         })
     }
     
+    /// Set when the database file is fsynced
+    pub fn set_sync_mode(&mut self, mode: SyncMode) {
+        self.sync_mode = mode;
+    }
+    
+    /// Get the current sync mode
+    pub fn sync_mode(&self) -> SyncMode {
+        self.sync_mode
+    }
+    
     /// Enable transaction mode
     pub fn begin_transaction_mode(&mut self) {
         self.transaction_mode = true;
         self.shadow_pages.clear();
         self.modified_pages.clear();
+        self.tx_header = Some(self.header.clone());
     }
     
     /// Disable transaction mode and clear state
@@ -120,6 +173,7 @@ impl Pager {
         self.transaction_mode = false;
         self.shadow_pages.clear();
         self.modified_pages.clear();
+        self.tx_header = None;
     }
     
     /// Get modified pages from transaction
@@ -150,6 +204,13 @@ impl Pager {
             return Ok(page.clone());
         }
         
+        // Pages written in this transaction are not on disk yet
+        if let Some(page) = self.modified_pages.get(&page_id) {
+            let page = page.clone();
+            self.add_to_cache(page.clone());
+            return Ok(page);
+        }
+        
         // Validate page ID
         if page_id == 0 {
             return Err(Error::InvalidPage("Page ID cannot be 0".to_string()));
@@ -186,8 +247,12 @@ impl Pager {
         }
         
         if self.transaction_mode {
-            // In transaction mode: save shadow copy and track modification
-            if !self.shadow_pages.contains_key(&page_id) {
+            // In transaction mode: save shadow copy and track modification.
+            // Pages allocated in this transaction have no original to save.
+            let existed = self.tx_header
+                .as_ref()
+                .map_or(true, |header| page_id <= header.page_count);
+            if existed && !self.shadow_pages.contains_key(&page_id) {
                 // Save original page data
                 let original = if let Some(cached) = self.cache.get(&page_id) {
                     cached.data.clone()
@@ -251,20 +316,45 @@ impl Pager {
             self.file.seek(SeekFrom::Start(offset))?;
             self.file.write_all(&original_data)?;
         }
+        
+        // Forget pages allocated in the transaction
+        let new_pages: Vec<PageId> = self.modified_pages.keys()
+            .filter(|id| !self.shadow_pages.contains_key(id))
+            .copied()
+            .collect();
+        for page_id in new_pages {
+            self.cache.remove(&page_id);
+        }
+        
+        // Restore page count, root page and free list
+        if let Some(header) = self.tx_header.clone() {
+            self.header = header;
+            self.write_header()?;
+        }
         Ok(())
     }
     
     /// Allocate a new page
+    /// 
+    /// Reuses the first page on the free list, otherwise grows the file.
     pub fn allocate_page(&mut self, page_type: PageType) -> Result<Page> {
-        // TODO: Use free list if available
-        
-        // Allocate new page at end of file
-        let page_id = self.header.page_count + 1;
+        let page_id = if self.header.first_free_page != 0 {
+            // Pop the free list (next pointer is stored in the first 4 bytes)
+            let free_id = self.header.first_free_page;
+            let free_page = self.read_page(free_id)?;
+            self.header.first_free_page = u32::from_be_bytes([
+                free_page.data[0], free_page.data[1], free_page.data[2], free_page.data[3],
+            ]);
+            free_id
+        } else {
+            // Allocate new page at end of file
+            self.header.page_count += 1;
+            self.header.page_count
+        };
         let mut page = Page::new(page_id, self.page_size);
         page.initialize(page_type, self.page_size)?;
         
         // Update header
-        self.header.page_count = page_id;
         self.write_header()?;
         
         // Write the new page
@@ -311,7 +401,9 @@ impl Pager {
             self.write_page(page)?;
         }
         
-        self.file.sync_all()?;
+        if self.sync_mode != SyncMode::Off {
+            self.file.sync_all()?;
+        }
         Ok(())
     }
     
@@ -323,7 +415,9 @@ impl Pager {
         
         self.file.seek(SeekFrom::Start(0))?;
         self.file.write_all(&header_page)?;
-        self.file.sync_all()?;
+        if self.sync_mode == SyncMode::Full {
+            self.file.sync_all()?;
+        }
         
         Ok(())
     }
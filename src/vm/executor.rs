@@ -100,6 +100,12 @@ impl Executor {
     pub fn execute(&mut self, program: &Program, pager: &mut Pager, table_schemas: &HashMap<String, TableSchema>) -> Result<QueryResult> {
         let mut pc = 0; // Program counter
         
+        // (Limit opcode index, rows needed) when the scan can stop early
+        let early_exit = Self::early_exit(program);
+        if let Some((limit_pc, 0)) = early_exit {
+            pc = limit_pc;
+        }
+        
         // Execution loop
         while pc < program.opcodes.len() {
             let opcode = &program.opcodes[pc];
@@ -263,7 +269,12 @@ impl Executor {
                 Opcode::ResultRow { register_start, register_count } => {
                     let row: Vec<Value> = self.registers[*register_start..*register_start + register_count].to_vec();
                     self.result.rows.push(row);
-                    pc += 1;
+                    
+                    match early_exit {
+                        // Enough rows for LIMIT/OFFSET: skip the rest of the scan
+                        Some((limit_pc, needed)) if self.result.rows.len() >= needed => pc = limit_pc,
+                        _ => pc += 1,
+                    }
                 }
                 
                 Opcode::Insert { cursor_id, register_start, register_count } => {
@@ -529,6 +540,23 @@ impl Executor {
         Ok(std::mem::take(&mut self.result))
     }
     
+    /// Where a LIMIT lets the scan stop early
+    /// 
+    /// Without Sort or aggregates, rows are produced in their final order,
+    /// so once `offset + limit` rows exist the rest can't be returned.
+    /// Returns the Limit opcode's index and that row count.
+    fn early_exit(program: &Program) -> Option<(usize, usize)> {
+        let mut limit = None;
+        for (i, opcode) in program.opcodes.iter().enumerate() {
+            match opcode {
+                Opcode::Sort { .. } | Opcode::Aggregate { .. } | Opcode::FinalizeAggregate { .. } => return None,
+                Opcode::Limit { limit: count, offset, .. } => limit = Some((i, offset.saturating_add(*count))),
+                _ => {}
+            }
+        }
+        limit
+    }
+    
     /// Sort result rows based on ORDER BY clauses
     fn sort_results_by_order_by(&mut self, order_by: &[crate::sql::ast::OrderBy]) -> Result<()> {
         use crate::sql::ast::OrderDirection;
@@ -710,4 +738,28 @@ mod tests {
         assert_eq!(result.rows[0].len(), 3);
         assert_eq!(result.rows[0][0], Value::Integer(1));
     }
+    
+    #[test]
+    fn test_limit_stops_scan_early() {
+        let mut executor = Executor::new();
+        executor.registers[0] = Value::Integer(7);
+        
+        // An endless "scan": only the LIMIT can end it
+        let mut program = Program::new();
+        program.add(Opcode::ResultRow { register_start: 0, register_count: 1 });
+        program.add(Opcode::Goto { target: 0 });
+        program.add(Opcode::Limit { limit: 2, offset: 1, counter_register: 0 });
+        program.add(Opcode::Halt);
+        assert_eq!(Executor::early_exit(&program), Some((2, 3)));
+        
+        let temp_file = NamedTempFile::new().unwrap();
+        let mut pager = Pager::open(temp_file.path()).unwrap();
+        let table_schemas = HashMap::new();
+        let result = executor.execute(&program, &mut pager, &table_schemas).unwrap();
+        assert_eq!(result.rows, vec![vec![Value::Integer(7)]; 2]);
+        
+        // Sorting needs every row first
+        program.opcodes.insert(2, Opcode::Sort { order_by: Vec::new() });
+        assert_eq!(Executor::early_exit(&program), None);
+    }
 }
@@ -3,7 +3,7 @@
 /// Handles writing frames to the WAL file and managing transactions
 
 use crate::error::{Error, Result};
-use crate::storage::{Page, PageId};
+use crate::storage::{Page, PageId, SyncMode};
 use crate::wal::frame::{WalFrame, WalHeader, WalFrameHeader};
 use std::collections::HashMap;
 use std::fs::{File, OpenOptions};
@@ -30,6 +30,9 @@ pub struct Wal {
     
     /// Number of frames written since last checkpoint
     frame_count: u32,
+    
+    /// When to fsync the WAL file
+    sync_mode: SyncMode,
 }
 
 impl Wal {
@@ -72,6 +75,7 @@ impl Wal {
             transaction_frames: HashMap::new(),
             in_transaction: false,
             frame_count: 0,
+            sync_mode: SyncMode::default(),
         })
     }
     
@@ -141,8 +145,11 @@ impl Wal {
             self.frame_count += 1;
         }
         
-        // Sync to disk (durability)
-        self.file.sync_all()?;
+        // Sync to disk before the pager writes these pages in place: the WAL
+        // is the only intact copy if those writes are torn. OFF skips it.
+        if self.sync_mode != SyncMode::Off {
+            self.file.sync_all()?;
+        }
         
         // Clear transaction
         self.transaction_frames.clear();
@@ -212,7 +219,9 @@ impl Wal {
         
         // Truncate file after header
         self.file.set_len(WalHeader::SIZE as u64)?;
-        self.file.sync_all()?;
+        if self.sync_mode != SyncMode::Off {
+            self.file.sync_all()?;
+        }
         
         self.frame_count = 0;
         
@@ -228,6 +237,11 @@ impl Wal {
     pub fn in_transaction(&self) -> bool {
         self.in_transaction
     }
+    
+    /// Set when the WAL file is fsynced
+    pub fn set_sync_mode(&mut self, mode: SyncMode) {
+        self.sync_mode = mode;
+    }
 }
 
 impl Drop for Wal {
@@ -251,6 +265,14 @@ mod tests {
         assert!(!wal.in_transaction());
     }
     
+    #[test]
+    fn test_sync_mode_parse() {
+        assert_eq!("off".parse::<SyncMode>().unwrap(), SyncMode::Off);
+        assert_eq!("NORMAL".parse::<SyncMode>().unwrap(), SyncMode::Normal);
+        assert_eq!("Full".parse::<SyncMode>().unwrap(), SyncMode::Full);
+        assert!("EXTRA".parse::<SyncMode>().is_err());
+    }
+    
     #[test]
     fn test_transaction_lifecycle() {
         let temp_file = NamedTempFile::new().unwrap();
@@ -4,12 +4,15 @@ Tests for Python bindings
 import pytest
 import sys
 import os
+from array import array
 
 # Add parent directory to path for imports
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'python'))
 
+import deepsql
+
 try:
-    import deepsql
+    import deepsql._deepsql
 except ImportError:
     pytest.skip("Python bindings not built", allow_module_level=True)
 
@@ -21,6 +24,79 @@ def test_connect():
     db.close()
 
 
+def test_database_shim():
+    """Test the pure-Python Database wrapper"""
+    db = deepsql.Database(":memory:")
+    db.insert_kv(b"key1", b"value1")
+    assert db.search_kv(b"key1") == b"value1"
+    assert repr(db) == "Database(':memory:')"
+    db.close()
+
+
+def test_connect_reuse():
+    """Test reusing an open connection for the same path"""
+    db = deepsql.connect(":memory:", reuse=True)
+    assert deepsql.connect(":memory:", reuse=True) is db
+    assert deepsql.connect(":memory:") is not db
+    
+    db.close()
+    assert db.closed
+    db2 = deepsql.connect(":memory:", reuse=True)
+    assert db2 is not db
+    db2.close()
+
+
+def test_connect_reuse_forgets_connections(tmp_path):
+    """Test that the reuse cache drops closed and collected connections"""
+    import gc
+    
+    closed_path = str(tmp_path / "closed.db")
+    db = deepsql.connect(closed_path, reuse=True)
+    assert os.path.abspath(closed_path) in deepsql._CONNECTION_CACHE
+    db.close()
+    
+    # Closed entries are pruned on the next reuse lookup
+    other_path = str(tmp_path / "other.db")
+    other = deepsql.connect(other_path, reuse=True)
+    assert os.path.abspath(closed_path) not in deepsql._CONNECTION_CACHE
+    
+    # Collected entries are removed by the weak dictionary
+    del other
+    gc.collect()
+    assert os.path.abspath(other_path) not in deepsql._CONNECTION_CACHE
+
+
+def test_connect_reuse_collect_while_locked(tmp_path):
+    """Test that collecting a cached connection inside connect() can't deadlock"""
+    import gc
+    
+    path = str(tmp_path / "cycle.db")
+    cycle = [deepsql.connect(path, reuse=True)]
+    cycle.append(cycle)
+    del cycle
+    
+    # Stands in for a GC pass triggered while connect() holds the lock
+    with deepsql._CONNECTION_CACHE_LOCK:
+        gc.collect()
+    assert os.path.abspath(path) not in deepsql._CONNECTION_CACHE
+
+
+def test_connect_reuse_after_close(tmp_path):
+    """Test that a closed connection releases its file locks"""
+    path = str(tmp_path / "reopen.db")
+    db = deepsql.connect(path, reuse=True)
+    db.insert_kv(b"key", b"value")
+    db.close()
+    
+    # db is still referenced, but must not block a new connection
+    db2 = deepsql.connect(path, reuse=True)
+    assert db2 is not db
+    assert db2.search_kv(b"key") == b"value"
+    with pytest.raises(Exception):
+        db.search_kv(b"key")
+    db2.close()
+
+
 def test_context_manager():
     """Test context manager support"""
     with deepsql.connect(":memory:") as db:
@@ -31,9 +107,12 @@ def test_context_manager():
 def test_transaction():
     """Test transaction management"""
     with deepsql.connect(":memory:") as db:
+        assert not db.in_transaction
         db.begin()
+        assert db.in_transaction
         # Do some operations
         db.commit()
+        assert not db.in_transaction
 
 
 def test_transaction_rollback():
@@ -44,6 +123,29 @@ def test_transaction_rollback():
         db.rollback()
 
 
+def test_transaction_context():
+    """Test the transaction() context manager"""
+    with deepsql.connect(":memory:") as db:
+        with db.transaction():
+            db.insert_kv(b"a", b"1")
+            db.insert_kv(b"b", b"2")
+        assert db.search_kv(b"a") is not None
+        
+        with pytest.raises(RuntimeError):
+            with db.transaction():
+                db.insert_kv(b"c", b"3")
+                raise RuntimeError("abort")
+        assert db.search_kv(b"c") is None
+
+
+def test_insert_many():
+    """Test batched inserts in one transaction"""
+    with deepsql.connect(":memory:") as db:
+        records = [(f"key_{i:03d}".encode(), b"value") for i in reversed(range(50))]
+        assert db.insert_many(records) == 50
+        assert db.search_kv(b"key_010") is not None
+
+
 def test_kv_operations():
     """Test low-level key-value operations"""
     with deepsql.connect(":memory:") as db:
@@ -52,7 +154,7 @@ def test_kv_operations():
         
         # Search
         value = db.search_kv(b"key1")
-        assert value == b"key1"  # Current implementation returns key
+        assert value == b"value1"
         
         # Delete
         db.delete_kv(b"key1")
@@ -62,6 +164,92 @@ def test_kv_operations():
         assert value is None
 
 
+def test_kv_bytes_like_keys():
+    """Test that bytes and bytearray keys are interchangeable"""
+    with deepsql.connect(":memory:") as db:
+        db.insert_kv(bytearray(b"key1"), b"value1")
+        
+        value = db.search_kv(b"key1")
+        assert value == b"value1"
+        assert db.search_kv(bytearray(b"key1")) == value
+        
+        db.delete_kv(bytearray(b"key1"))
+        assert db.search_kv(b"key1") is None
+
+
+def test_search_kv_into():
+    """Test searching into a caller-provided buffer"""
+    with deepsql.connect(":memory:") as db:
+        db.insert_kv(b"key1", b"value1")
+        
+        out = bytearray(2)
+        n = db.search_kv_into(b"key1", out)
+        assert n == 6
+        assert bytes(out[:n]) == b"value1"
+        
+        assert db.search_kv_into(b"missing", out) is None
+
+
+def test_search_kv_many():
+    """Test batched key-value search"""
+    with deepsql.connect(":memory:") as db:
+        db.insert_many([(b"a", b"1"), (b"b", b"2")])
+        
+        results = db.search_kv_many([b"b", b"missing", b"a"])
+        assert results == [b"2", None, b"1"]
+        
+        # Same key types as search_kv
+        assert db.search_kv_many([bytearray(b"a"), b"b"]) == [b"1", b"2"]
+        with pytest.raises(TypeError):
+            db.search_kv_many(["a"])
+
+
+def test_synchronous_mode(tmp_path):
+    """Test toggling fsync policy and manual checkpoints"""
+    with deepsql.connect(str(tmp_path / "sync.db")) as db:
+        assert db.synchronous == "FULL"
+        
+        db.set_synchronous("off")
+        assert db.synchronous == "OFF"
+        db.insert_many([(b"a", b"1"), (b"b", b"2")])
+        
+        # The commit left its pages in the WAL for the checkpoint to copy
+        db.set_synchronous("FULL")
+        assert db.checkpoint() > 0
+        assert db.checkpoint() == 0
+        assert db.search_kv(b"b") == b"2"
+        
+        with pytest.raises(ValueError):
+            db.set_synchronous("SOMETIMES")
+
+
+def test_synchronous_mode_shim(tmp_path):
+    """Test the fsync policy through the pure-Python Database wrapper"""
+    db = deepsql.Database(str(tmp_path / "sync_shim.db"))
+    assert db.synchronous == "FULL"
+    db.set_synchronous("NORMAL")
+    assert db.synchronous == "NORMAL"
+    db.close()
+
+
+def test_concurrent_reads_during_bulk_load():
+    """Test that reads from another thread wait for a bulk load without deadlocking"""
+    import threading
+    
+    with deepsql.connect(":memory:") as db:
+        db.insert_kv(b"key_00000", b"before")
+        records = [(f"key_{i:05d}".encode(), b"after") for i in range(20000)]
+        
+        loader = threading.Thread(target=db.bulk_load, args=(records,))
+        loader.start()
+        while loader.is_alive():
+            assert db.search_kv(b"key_00000") in (b"before", b"after")
+            assert db.synchronous == "FULL"
+        loader.join()
+        
+        assert db.search_kv(b"key_00000") == b"after"
+
+
 def test_cache_stats():
     """Test plan cache statistics"""
     with deepsql.connect(":memory:") as db:
@@ -81,6 +269,129 @@ def test_clear_cache():
             assert stats.size == 0
 
 
+def test_execute_and_query():
+    """Test running SQL statements through the engine"""
+    with deepsql.connect(":memory:") as db:
+        db.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT)")
+        assert db.execute("INSERT INTO users VALUES (1, 'Alice')") == 1
+        assert db.execute("INSERT INTO users VALUES (2, 'Bob')") == 1
+        assert not db.in_transaction
+        
+        assert db.query("SELECT * FROM users") == [(1, 'Alice'), (2, 'Bob')]
+        assert db.query("SELECT name FROM users WHERE id > 1") == [('Bob',)]
+        
+        # Repeated SQL text reuses the cached statement
+        for _ in range(3):
+            assert db.query("SELECT id FROM users") == [(1,), (2,)]
+        
+        with pytest.raises(Exception):
+            db.query("SELECT * FROM missing")
+
+
+def test_statement_cache_keeps_literals():
+    """Test that statements differing only inside a literal are cached apart"""
+    with deepsql.connect(":memory:") as db:
+        db.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT)")
+        db.execute("INSERT INTO users VALUES (1, 'x y')")
+        db.execute("INSERT INTO users VALUES (2, 'x  y')")
+        
+        assert db.query("SELECT id FROM users WHERE name = 'x y'") == [(1,)]
+        assert db.query("SELECT id FROM users WHERE name = 'x  y'") == [(2,)]
+        
+        db.execute("UPDATE users SET name = 'a b' WHERE id = 1")
+        db.execute("UPDATE users SET name = 'a  b' WHERE id = 1")
+        assert db.query("SELECT name FROM users WHERE id = 1") == [('a  b',)]
+
+
+def test_sql_transaction():
+    """Test BEGIN/ROLLBACK statements driving the engine transaction"""
+    with deepsql.connect(":memory:") as db:
+        db.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT)")
+        db.execute("INSERT INTO users VALUES (1, 'Alice')")
+        
+        db.execute("BEGIN")
+        assert db.in_transaction
+        db.execute("INSERT INTO users VALUES (2, 'Bob')")
+        assert len(db.query("SELECT * FROM users")) == 2
+        db.execute("ROLLBACK")
+        
+        assert not db.in_transaction
+        assert db.query("SELECT * FROM users") == [(1, 'Alice')]
+
+
+def test_prepared_statement():
+    """Test preparing and re-running a statement"""
+    with deepsql.connect(":memory:") as db:
+        db.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT)")
+        db.execute("INSERT INTO users VALUES (1, 'Alice')")
+        
+        stmt = db.prepare("SELECT * FROM users")
+        assert stmt.sql == "SELECT * FROM users"
+        for _ in range(3):
+            assert db.query_prepared(stmt) == [(1, 'Alice')]
+        
+        update = db.prepare("UPDATE users SET name = 'Alicia' WHERE id = 1")
+        assert db.execute_prepared(update) == 1
+        assert db.query_prepared(stmt) == [(1, 'Alicia')]
+
+
+def test_query_one():
+    """Test fetching only the first row"""
+    with deepsql.connect(":memory:") as db:
+        db.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT)")
+        assert db.query_one("SELECT * FROM users") is None
+        
+        for i, name in enumerate(['Alice', 'Bob', 'Carol'], start=1):
+            db.execute(f"INSERT INTO users VALUES ({i}, '{name}')")
+        
+        assert db.query_one("SELECT * FROM users") == (1, 'Alice')
+        assert db.query_one("SELECT name FROM users ORDER BY id DESC") == ('Carol',)
+        assert db.query_one("SELECT * FROM users WHERE id > 1") == (2, 'Bob')
+        
+        # An explicit LIMIT is kept when smaller, capped at one row otherwise
+        assert db.query_one("SELECT * FROM users LIMIT 5") == (1, 'Alice')
+        assert db.query_one("SELECT * FROM users LIMIT 0") is None
+        
+        # The cached statement keeps its original LIMIT for query()
+        assert len(db.query("SELECT * FROM users LIMIT 5")) == 3
+
+
+def test_query_columns():
+    """Test column-oriented query results"""
+    with deepsql.connect(":memory:") as db:
+        db.execute("CREATE TABLE users (id INTEGER PRIMARY KEY, name TEXT)")
+        
+        # An empty result still has one container per column
+        ids, names = db.query_columns("SELECT * FROM users")
+        assert ids == [] and names == []
+        assert db.query_columns("SELECT name FROM users") == [[]]
+        
+        db.execute("INSERT INTO users VALUES (1, 'Alice')")
+        ids, names = db.query_columns("SELECT * FROM users")
+        assert ids.tolist() == [1]
+        assert names == ['Alice']
+
+
+def test_query_columns_types():
+    """Test typed arrays for INTEGER/REAL columns and lists otherwise"""
+    with deepsql.connect(":memory:") as db:
+        db.execute("CREATE TABLE t (id INTEGER PRIMARY KEY, score REAL, note TEXT)")
+        db.execute("INSERT INTO t VALUES (1, 1.5, 'x')")
+        db.execute("INSERT INTO t VALUES (2, 2.5, 7)")
+        db.execute("INSERT INTO t VALUES (3, 3.5, 'z')")
+        
+        ids, scores, notes = db.query_columns("SELECT * FROM t")
+        assert isinstance(ids, array) and ids.typecode == 'q'
+        assert ids.tolist() == [1, 2, 3]
+        assert isinstance(scores, array) and scores.typecode == 'd'
+        assert scores.tolist() == [1.5, 2.5, 3.5]
+        assert notes == ['x', 7, 'z']  # Mixed types fall back to a list
+        
+        # Columns line up with row-oriented results
+        rows = db.query("SELECT * FROM t")
+        assert [tuple(col[i] for col in (ids, scores, notes)) for i in range(3)] == rows
+
+
 def test_bulk_load():
     """Test bulk loading"""
     with deepsql.connect(":memory:") as db:
@@ -90,9 +401,141 @@ def test_bulk_load():
             for i in range(100)
         ]
         
-        # Bulk load (placeholder implementation returns 0)
         count = db.bulk_load(records)
-        assert count >= 0  # Placeholder implementation
+        assert count == 100
+
+
+def test_bulk_load_large():
+    """Test bulk loading enough records to span many pages"""
+    with deepsql.connect(":memory:") as db:
+        records = [
+            (f"key_{i:05d}".encode(), f"value_{i}".encode())
+            for i in range(2000)
+        ]
+        
+        assert db.bulk_load(records) == 2000
+        assert not db.in_transaction
+        for key, value in records:
+            assert db.search_kv(key) == value
+        assert db.search_kv(b"key_99999") is None
+
+
+def test_bulk_load_unsorted():
+    """Test bulk loading unsorted input with duplicate keys"""
+    with deepsql.connect(":memory:") as db:
+        records = [(b"b", b"1"), (b"a", b"2"), (b"b", b"3")]
+        assert db.bulk_load(records) == 2
+        assert db.search_kv(b"a") == b"2"
+        assert db.search_kv(b"b") == b"3"  # Last duplicate wins
+
+
+def test_bulk_load_empty_clears():
+    """Test that an empty bulk load replaces the records like any other"""
+    with deepsql.connect(":memory:") as db:
+        db.bulk_load([(b"a", b"1"), (b"b", b"2")])
+        assert db.bulk_load([]) == 0
+        assert db.search_kv(b"a") is None
+        assert db.search_kv(b"b") is None
+
+
+def test_record_lists_accept_bytearray():
+    """Test bytearray keys and values in bulk_load and insert_many"""
+    with deepsql.connect(":memory:") as db:
+        assert db.bulk_load([(bytearray(b"a"), bytearray(b"1")), (b"b", bytearray(b"2"))]) == 2
+        assert db.insert_many([(bytearray(b"c"), b"3")]) == 1
+        assert db.search_kv_many([b"a", b"b", b"c"]) == [b"1", b"2", b"3"]
+        
+        with pytest.raises(TypeError):
+            db.bulk_load([("a", b"1")])
+
+
+def test_bulk_load_unsorted_large():
+    """Test bulk loading shuffled input spanning many pages"""
+    import random
+    
+    with deepsql.connect(":memory:") as db:
+        records = [(f"key_{i:05d}".encode(), f"value_{i}".encode()) for i in range(1200)]
+        shuffled = records[:]
+        random.Random(0).shuffle(shuffled)
+        
+        assert db.bulk_load(shuffled + [(b"key_00007", b"replaced")]) == 1200
+        assert db.search_kv(b"key_00007") == b"replaced"
+        for key, value in records:
+            if key != b"key_00007":
+                assert db.search_kv(key) == value
+
+
+def test_bulk_load_buffers():
+    """Test bulk loading from packed buffers"""
+    with deepsql.connect(":memory:") as db:
+        records = [
+            (f"key_{i:05d}".encode(), f"value_{i}".encode())
+            for i in range(1500)
+        ]
+        
+        keys, key_offsets, values, value_offsets = deepsql.pack_records(records)
+        assert len(key_offsets) == len(records) + 1
+        
+        count = db.bulk_load_buffers(keys, key_offsets, values, value_offsets)
+        assert count == 1500
+        for key, value in records:
+            assert db.search_kv(key) == value
+
+
+def test_bulk_load_buffers_invalid_offsets():
+    """Test that out-of-range offsets are rejected"""
+    with deepsql.connect(":memory:") as db:
+        with pytest.raises(ValueError):
+            db.bulk_load_buffers(b"ab", array('Q', [0, 5]), b"x", array('Q', [0, 1]))
+
+
+def test_bulk_load_numpy():
+    """Test bulk loading from fixed-width column buffers"""
+    with deepsql.connect(":memory:") as db:
+        n = 1500
+        keys = b"".join(f"key_{i:05d}".encode() for i in range(n))
+        values = b"".join(f"val_{i:05d}".encode() for i in range(n))
+        
+        count = db.bulk_load_numpy(
+            memoryview(keys).cast('B', (n, 9)),
+            memoryview(values).cast('B', (n, 9)),
+        )
+        assert count == n
+        for i in range(n):
+            assert db.search_kv(f"key_{i:05d}".encode()) == f"val_{i:05d}".encode()
+
+
+def test_bulk_load_numpy_shape_mismatch():
+    """Test that key and value matrices must have the same row count"""
+    with deepsql.connect(":memory:") as db:
+        with pytest.raises(ValueError):
+            db.bulk_load_numpy(
+                memoryview(b"aabb").cast('B', (2, 2)),
+                memoryview(b"xyz").cast('B', (3, 1)),
+            )
+
+
+def test_lazy_extension_attributes():
+    """Test that extension classes resolve through the module"""
+    assert deepsql.CacheStats is deepsql._deepsql.CacheStats
+    with pytest.raises(AttributeError):
+        deepsql.does_not_exist
+    assert 'CacheStats' in deepsql.__all__
+
+
+def test_missing_extension_attributes(monkeypatch):
+    """Test that a missing extension does not break attribute probing"""
+    def missing():
+        raise ImportError("DeepSQL Rust extension not available")
+    
+    monkeypatch.setattr(deepsql, '_extension', missing)
+    assert not hasattr(deepsql, 'CacheStats')
+    assert 'CacheStats' not in deepsql.__all__
+    
+    namespace = {}
+    exec("from deepsql import *", namespace)
+    assert 'connect' in namespace
+    assert 'CacheStats' not in namespace
 
 
 def test_version():